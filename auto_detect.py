@@ -7,121 +7,155 @@ import ctypes
 import ctypes.wintypes
 import struct
 import json
+import numpy as np
 import time
 import sys
 
 from reader import MEMORY_BASIC_INFORMATION, MEM_COMMIT, READABLE_PAGES, get_memory_regions, load_knowledge, get_display_fields, read_all_fields, format_status
 
 
+# Minimum seconds between progress line updates during the scan
+_PROGRESS_INTERVAL = 0.1
+
+# Byte offsets (relative to HP) read by the structural scan, and the widest
+# window they span.  Positions closer than _SCAN_BEFORE to the region start
+# or _SCAN_AFTER to the region end are skipped.
+_SCAN_BEFORE = 96
+_SCAN_AFTER = 100
+
+# Fields the survivor loop needs, in unpack order: 外功, 根骨, 技巧, 等級,
+# 血量, 最大血量, 真氣, 最大真氣, 物攻, 防禦
+_SURVIVOR_OFFSETS = (-96, -88, -80, -36, 0, 4, 8, 12, 72, 84)
+
+
+def _build_survivor_struct(offsets):
+    """Build one Struct that unpacks exactly *offsets* (relative to HP), skipping
+    the bytes in between with pad codes, starting at HP - _SCAN_BEFORE."""
+    fmt = ['<']
+    pos = -_SCAN_BEFORE
+    for off in offsets:
+        if off > pos:
+            fmt.append(f'{off - pos}x')
+        fmt.append('i')
+        pos = off + 4
+    return struct.Struct(''.join(fmt))
+
+
+_SURVIVOR_STRUCT = _build_survivor_struct(_SURVIVOR_OFFSETS)
+
+# Offset groups checked against a shared range in _validate_candidates
+_ATTR_OFFSETS = (-96, -88, -80)         # 外功, 根骨, 技巧
+_COMBAT_OFFSETS = (72, 84, 92, 96)      # 物攻, 防禦, 命中, 閃躲
+
+
+def _hp_prefilter(arr, start, stop):
+    """Stage 1: int32 indices in [start, stop) whose HP/MaxHP pair is plausible.
+
+    Only two contiguous views are touched, so this pass is cheap even over
+    multi-MB regions; typically a few thousand indices survive.
+    """
+    hp = arr[start:stop]
+    max_hp = arr[start + 1:stop + 1]
+    # HP / MaxHP in range, HP <= MaxHP, MaxHP not far above HP.
+    # hp * 3 may wrap for out-of-range values, which the range checks reject.
+    mask = (hp >= 100) & (hp <= 999999) & (max_hp <= 999999)
+    mask &= (hp <= max_hp) & (max_hp <= hp * 3)
+    return np.flatnonzero(mask) + start
+
+
+def _validate_candidates(arr, idx):
+    """Stage 2: apply the remaining hard checks to the prefiltered indices *idx*.
+
+    Every range check is folded into one boolean mask; only the derived
+    ratio / spread checks are left for the Python loop over survivors.
+    """
+    def field(off):
+        return arr[idx + off // 4]
+
+    hp = field(0)
+    max_hp = field(4)
+    mp = field(8)
+    max_mp = field(12)
+    level = field(-36)
+    weight = field(24)
+    max_weight = field(28)
+
+    # Reject incrementing sequences (fake data pattern)
+    mask = ~((max_hp - hp <= 1) & (hp > 100) & (np.abs(mp - max_hp) <= 2))
+    # MP / MaxMP
+    mask &= (mp >= 1) & (mp <= 999999) & (max_mp >= 1) & (max_mp <= 999999)
+    mask &= (mp <= max_mp) & (max_mp <= mp * 3)
+    # Level, and HP at least 10x level
+    mask &= (level >= 1) & (level <= 999) & (hp >= level * 10)
+    # Attributes: 外功(-96), 根骨(-88), 技巧(-80)
+    for off in _ATTR_OFFSETS:
+        stat = field(off)
+        mask &= (stat >= 1) & (stat <= 9999)
+    # Weight / MaxWeight
+    mask &= (weight >= 0) & (weight <= 999999) & (max_weight >= 1) & (max_weight <= 999999)
+    mask &= weight <= max_weight
+    # Combat stats in range and never above HP: 物攻(72), 防禦(84), 命中(92), 閃躲(96)
+    for off in _COMBAT_OFFSETS:
+        stat = field(off)
+        mask &= (stat >= 1) & (stat <= 99999) & (stat <= hp)
+    # 物攻(72) 和 物攻基礎(76) 應相近; int64 so the difference cannot wrap
+    atk = field(72).astype(np.int64)
+    atk_base = field(76).astype(np.int64)
+    mask &= (atk_base > 0) & (np.abs(atk - atk_base) <= atk * 0.5)
+    return idx[mask]
+
+
 def scan_for_character(pm):
     """用結構特徵掃描，不需要已知值"""
-    regions = get_memory_regions(pm.process_handle)
+    # The character struct lives on the heap: skip image / file-mapped regions
+    regions = get_memory_regions(pm.process_handle, only_private_rw=True)
     knowledge = load_knowledge()
     fields = knowledge['character_structure']['fields']
 
+    # Span of the displayed fields around HP: each candidate keeps a copy of just
+    # these bytes, so main() can show it without a re-read or holding the region
+    display_offsets = [offset for offset, _ in get_display_fields(knowledge)]
+    span_lo = min(display_offsets, default=0)
+    span_hi = max(display_offsets, default=0) + 4
+
     total_size = sum(s for _, s in regions)
     scanned = 0
     candidates = []
+    last_print = time.monotonic()
 
     for base, size in regions:
         try:
             buffer = pm.read_bytes(base, size)
-            # 每 4 bytes 對齊掃描
-            for pos in range(0, len(buffer) - 100, 4):
-                # 快速篩選: offset 0 = HP, offset 4 = MaxHP
-                hp = struct.unpack_from('<i', buffer, pos)[0]
-                max_hp = struct.unpack_from('<i', buffer, pos + 4)[0]
-
-                # HP 和 MaxHP 必須在合理範圍，且 HP <= MaxHP
-                if not (100 <= hp <= 999999 and 100 <= max_hp <= 999999):
-                    continue
-                if hp > max_hp:
-                    continue
-
-                # MaxHP 不應比 HP 大太多 (排除假陽性如 HP=332, MaxHP=907848)
-                if max_hp > hp * 3:
-                    continue
-
-                # 排除連續遞增數列 (假資料特徵)
-                if max_hp - hp <= 1 and hp > 100:
-                    # 再檢查 MP 是不是也在遞增
-                    mp_raw = struct.unpack_from('<i', buffer, pos + 8)[0]
-                    if abs(mp_raw - max_hp) <= 2:
-                        continue
-
-                # MP 檢查: offset 8, 12
-                mp = struct.unpack_from('<i', buffer, pos + 8)[0]
-                max_mp = struct.unpack_from('<i', buffer, pos + 12)[0]
-                if not (1 <= mp <= 999999 and 1 <= max_mp <= 999999):
-                    continue
-                if mp > max_mp:
-                    continue
-                if max_mp > mp * 3:
-                    continue
-
-                # HP 應該遠大於等級 (等級192的角色HP有46277)
-                # 等級檢查: offset -36
-                if pos < 96:  # 確保負偏移不越界
-                    continue
-
-                level = struct.unpack_from('<i', buffer, pos - 36)[0]
-                if not (1 <= level <= 999):
-                    continue
-
-                # HP 應至少是等級的 10 倍 (合理假設)
-                if hp < level * 10:
-                    continue
-
-                # 屬性檢查: 外功(-96), 根骨(-88), 技巧(-80)
-                wai_gong = struct.unpack_from('<i', buffer, pos - 96)[0]
-                gen_gu = struct.unpack_from('<i', buffer, pos - 88)[0]
-                ji_qiao = struct.unpack_from('<i', buffer, pos - 80)[0]
-
-                if not (1 <= wai_gong <= 9999 and 1 <= gen_gu <= 9999 and 1 <= ji_qiao <= 9999):
-                    continue
-
-                # 負重: offset 24, 28
-                weight = struct.unpack_from('<i', buffer, pos + 24)[0]
-                max_weight = struct.unpack_from('<i', buffer, pos + 28)[0]
-                if not (0 <= weight <= 999999 and 1 <= max_weight <= 999999):
-                    continue
-                if weight > max_weight:
-                    continue
-
-                # 戰鬥屬性不應遠大於HP (排除假資料如防禦=31006)
-                # 戰鬥屬性: 物攻(72), 防禦(84), 命中(92), 閃躲(96)
-                atk = struct.unpack_from('<i', buffer, pos + 72)[0]
-                defense = struct.unpack_from('<i', buffer, pos + 84)[0]
-                hit = struct.unpack_from('<i', buffer, pos + 92)[0]
-                dodge = struct.unpack_from('<i', buffer, pos + 96)[0]
-
-                if not (1 <= atk <= 99999 and 1 <= defense <= 99999):
-                    continue
-                if not (1 <= hit <= 99999 and 1 <= dodge <= 99999):
-                    continue
-                # 戰鬥屬性都不應超過 HP (正常遊戲裡攻防 < HP)
-                if atk > hp or defense > hp or hit > hp or dodge > hp:
-                    continue
+            arr = np.frombuffer(buffer, dtype='<i4', count=len(buffer) // 4)
+            # Scanned byte positions: _SCAN_BEFORE <= pos < len(buffer) - _SCAN_AFTER
+            start = _SCAN_BEFORE // 4
+            stop = (len(buffer) - _SCAN_AFTER + 3) // 4
+            if stop <= start:
+                scanned += size
+                continue
+
+            idx = _validate_candidates(arr, _hp_prefilter(arr, start, stop))
+
+            # Only the few survivors go through the derived checks in Python
+            unpack_from = _SURVIVOR_STRUCT.unpack_from
+            for i in idx.tolist():
+                pos = i * 4
+                (wai_gong, gen_gu, ji_qiao, level,
+                 hp, max_hp, mp, max_mp, atk, defense) = unpack_from(buffer, pos - _SCAN_BEFORE)
 
                 # HP 和 MP 不應幾乎相等 (真正角色 HP 通常遠大於 MP)
-                if mp > 0 and hp > 0:
-                    ratio = hp / mp
-                    if 0.8 < ratio < 1.2:
-                        continue
-
-                # 物攻(72) 和 物攻基礎(76) 應相近
-                atk_base = struct.unpack_from('<i', buffer, pos + 76)[0]
-                if atk_base <= 0 or abs(atk - atk_base) > atk * 0.5:
+                ratio = hp / mp
+                if 0.8 < ratio < 1.2:
                     continue
 
                 # 最後檢查: 這些值不能全都很接近 (排除遞增序列)
-                vals = [hp, mp, level, wai_gong, gen_gu, atk, defense]
-                vals_sorted = sorted(vals)
-                max_gap = max(vals_sorted[i+1] - vals_sorted[i] for i in range(len(vals_sorted)-1))
+                vals_sorted = sorted((hp, mp, level, wai_gong, gen_gu, atk, defense))
+                max_gap = max(b - a for a, b in zip(vals_sorted, vals_sorted[1:]))
                 if max_gap < 10:
                     continue
 
                 addr = base + pos
+                lo = max(pos + span_lo, 0)
                 candidates.append({
                     'addr': addr,
                     'hp': hp, 'max_hp': max_hp,
@@ -129,11 +163,18 @@ def scan_for_character(pm):
                     'level': level,
                     'stats': (wai_gong, gen_gu, ji_qiao),
                     'atk': atk, 'defense': defense,
+                    # Clipped at the region edges; read_all_fields falls back to
+                    # reading the process when the slice does not cover every field
+                    'snapshot': (buffer[lo:pos + span_hi], base + lo),
                 })
 
             scanned += size
-            pct = scanned / total_size * 100
-            print(f"  掃描進度: {pct:.0f}%  候選: {len(candidates)}", end='\r')
+            # Console writes are slow on Windows; refresh the progress line at most every 100ms
+            now = time.monotonic()
+            if now - last_print >= _PROGRESS_INTERVAL:
+                last_print = now
+                pct = scanned / total_size * 100
+                print(f"  掃描進度: {pct:.0f}%  候選: {len(candidates)}", end='\r')
         except Exception:
             scanned += size
 
@@ -160,13 +201,11 @@ def main():
         return
 
     # 去重: 相同 HP/MaxHP/Level 的只保留第一個
-    seen = set()
-    unique = []
+    # setdefault keeps the first candidate per key with one hash lookup each
+    first_by_key = {}
     for c in candidates:
-        key = (c['hp'], c['max_hp'], c['level'])
-        if key not in seen:
-            seen.add(key)
-            unique.append(c)
+        first_by_key.setdefault((c['hp'], c['max_hp'], c['level']), c)
+    unique = list(first_by_key.values())
 
     print(f"\n找到 {len(unique)} 個不同角色 ({elapsed:.2f}s):\n")
 
@@ -175,7 +214,7 @@ def main():
     for i, c in enumerate(unique):
         print(f"--- 角色 {i+1} ---")
         print(f"  地址: 0x{c['addr']:08X}")
-        fields_data = read_all_fields(pm, c['addr'], display_fields)
+        fields_data = read_all_fields(pm, c['addr'], display_fields, c['snapshot'])
         print(format_status(fields_data))
         print()
 
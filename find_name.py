@@ -12,13 +12,14 @@ Example:
 import sys
 import struct
 import time
+import numpy as np
 import pymem
 import ctypes
 import ctypes.wintypes
 
 # Re-use infrastructure from reader.py
 sys.path.insert(0, '.')
-from reader import get_memory_regions, locate_character, load_knowledge
+from reader import RegionCache, get_memory_regions, locate_character, load_knowledge
 
 
 ENCODINGS = ['big5', 'gbk', 'utf-8']
@@ -26,12 +27,17 @@ ENCODINGS = ['big5', 'gbk', 'utf-8']
 # ============================================================
 # Search memory for a byte pattern
 # ============================================================
-def search_bytes(pm, regions, pattern):
-    """Return list of addresses where pattern occurs."""
-    hits = []
+def iter_search_bytes(pm, regions, pattern, cache=None):
+    """Yield addresses where pattern occurs, region by region, as they are found.
+
+    Callers that only need the first few hits can stop iterating early and
+    the remaining regions are never read.
+    cache: optional RegionCache so repeated searches reuse the region bytes.
+    """
+    read = cache.get if cache is not None else pm.read_bytes
     for base, size in regions:
         try:
-            buffer = pm.read_bytes(base, size)
+            buffer = read(base, size)
         except Exception:
             continue
         offset = 0
@@ -39,9 +45,8 @@ def search_bytes(pm, regions, pattern):
             pos = buffer.find(pattern, offset)
             if pos == -1:
                 break
-            hits.append(base + pos)
+            yield base + pos
             offset = pos + 1
-    return hits
 
 
 # ============================================================
@@ -68,6 +73,36 @@ def read_cstring(pm, addr, max_len=64):
 # ============================================================
 # Scan struct neighbourhood for pointers that might lead to strings
 # ============================================================
+def _heap_pointers_in_range(pm, hp_addr, start, end):
+    """Return [(offset, ptr)] for every uint32 in [start, end) from hp_addr that lies
+    in the valid 32-bit heap pointer range.
+
+    The whole window is read with one call; if that fails (e.g. it crosses an
+    unreadable page) each offset is read individually instead.
+    """
+    count = (end - start + 3) // 4
+    try:
+        raw = pm.read_bytes(hp_addr + start, count * 4)
+    except Exception:
+        raw = None
+
+    if raw is not None:
+        ptrs = np.frombuffer(raw, dtype='<u4')
+        # Valid 32-bit heap pointer range
+        idx = np.flatnonzero((ptrs >= 0x01000000) & (ptrs <= 0x7FFFFFFF))
+        return [(start + int(i) * 4, int(ptrs[i])) for i in idx]
+
+    result = []
+    for off in range(start, end, 4):
+        try:
+            ptr = struct.unpack('<I', pm.read_bytes(hp_addr + off, 4))[0]
+        except Exception:
+            continue
+        if 0x01000000 <= ptr <= 0x7FFFFFFF:
+            result.append((off, ptr))
+    return result
+
+
 def scan_struct_pointers(pm, hp_addr, scan_range=(-256, 512)):
     """Check every int32 in range from hp_addr; if it looks like a valid
     heap pointer, try to read a string at that address."""
@@ -75,15 +110,7 @@ def scan_struct_pointers(pm, hp_addr, scan_range=(-256, 512)):
     start = scan_range[0]
     end = scan_range[1]
     found = []
-    for off in range(start, end, 4):
-        try:
-            raw = pm.read_bytes(hp_addr + off, 4)
-            ptr = struct.unpack('<I', raw)[0]
-        except Exception:
-            continue
-        # Valid 32-bit heap pointer range
-        if not (0x01000000 <= ptr <= 0x7FFFFFFF):
-            continue
+    for off, ptr in _heap_pointers_in_range(pm, hp_addr, start, end):
         # Try to read string at pointer
         text, enc = read_cstring(pm, ptr)
         if text and len(text) >= 2 and len(text) <= 32:
@@ -111,33 +138,37 @@ def dump_strings_near_hp(pm, hp_addr, before=512, after=1024):
 
     # Walk through and find runs of Big5/GBK bytes
     # Big5 lead byte: 0x81-0xFE, trail byte: 0x40-0xFE (except 0x7F)
+    # Locate every candidate lead byte in one vectorized pass and only visit those
+    arr = np.frombuffer(raw, dtype=np.uint8)[:-1]
+    lead_positions = np.flatnonzero((arr >= 0x81) & (arr <= 0xFE)).tolist()
     i = 0
-    while i < len(raw) - 1:
-        b = raw[i]
-        if 0x81 <= b <= 0xFE:
-            # Possible Big5/GBK lead byte - try to grab a run
-            j = i
-            while j < len(raw) - 1:
-                lb = raw[j]
-                if 0x81 <= lb <= 0xFE and 0x40 <= raw[j + 1] <= 0xFE and raw[j + 1] != 0x7F:
-                    j += 2
-                elif 0x20 <= lb < 0x7F:
-                    j += 1
-                else:
+    for start in lead_positions:
+        if start < i:
+            # Already consumed by the previous run
+            continue
+        i = start
+        # Possible Big5/GBK lead byte - try to grab a run
+        j = i
+        while j < len(raw) - 1:
+            lb = raw[j]
+            if 0x81 <= lb <= 0xFE and 0x40 <= raw[j + 1] <= 0xFE and raw[j + 1] != 0x7F:
+                j += 2
+            elif 0x20 <= lb < 0x7F:
+                j += 1
+            else:
+                break
+        run = raw[i:j]
+        if len(run) >= 4:
+            for enc in ['big5', 'gbk']:
+                try:
+                    text = run.decode(enc)
+                    offset_from_hp = (hp_addr - before + i) - hp_addr
+                    print(f"  HP+{offset_from_hp:+d}  '{text}'  [{enc}]")
                     break
-            run = raw[i:j]
-            if len(run) >= 4:
-                for enc in ['big5', 'gbk']:
-                    try:
-                        text = run.decode(enc)
-                        offset_from_hp = (hp_addr - before + i) - hp_addr
-                        print(f"  HP+{offset_from_hp:+d}  '{text}'  [{enc}]")
-                        break
-                    except Exception:
-                        pass
-            i = j
-        else:
-            i += 1
+                except Exception:
+                    pass
+        # A lone lead byte with no valid trail leaves j == i; always advance
+        i = max(j, i + 1)
 
 
 # ============================================================
@@ -173,23 +204,23 @@ def main():
     print(f"[OK] HP address: 0x{hp_addr:08X}  ({elapsed:.2f}s)")
 
     regions = get_memory_regions(pm.process_handle)
+    cache = RegionCache(pm)  # each encoding is searched over the same snapshot
 
     # --- 1. Direct string search ---
     print(f"\n[Direct search] Searching for name: '{char_name}'")
-    all_hits = []
     for enc in ENCODINGS:
         try:
             encoded = char_name.encode(enc)
         except Exception:
             print(f"  Cannot encode '{char_name}' as {enc}, skipping")
             continue
-        hits = search_bytes(pm, regions, encoded)
-        if hits:
-            for addr in hits:
-                rel = addr - hp_addr
-                print(f"  [{enc}]  0x{addr:08X}  (HP+{rel:+d})")
-            all_hits.extend(hits)
-        else:
+        # Print each hit as soon as it is found instead of after the full scan
+        found = False
+        for addr in iter_search_bytes(pm, regions, encoded, cache):
+            found = True
+            rel = addr - hp_addr
+            print(f"  [{enc}]  0x{addr:08X}  (HP+{rel:+d})")
+        if not found:
             print(f"  [{enc}]  not found")
 
     # --- 2. Pointer scan near struct ---
@@ -12,16 +12,24 @@ Example:
     uv run find_stable_chain.py 12340:33698 15672:48377
 """
 
-import sys
 import struct
+import sys
 import time
+from array import array
 
+import numpy as np
 import pymem
 
 from reader import (
+    RegionCache,
     get_memory_regions,
+    scatter_read,
 )
 
+_INT32 = struct.Struct("<i")
+# int32 at addr-0x10, addr and addr+0x10, read as one 0x24-byte window
+_HP_NEIGHBOURS = struct.Struct("<i12xi12xi")
+
 
 # ============================================================
 # Memory scanning infrastructure
@@ -38,6 +46,11 @@ def get_static_ranges(pm):
     return static_ranges
 
 
+def get_module_bases(pm):
+    """Return {module_name: base_address} from a single module snapshot."""
+    return {module.name: module.lpBaseOfDll for module in pm.list_modules()}
+
+
 def is_static(address, static_ranges):
     """Check if address falls within a loaded module (static/green address)."""
     for base, end, name in static_ranges:
@@ -60,12 +73,12 @@ def find_pointers_to(pm, target_addr, search_range, regions):
     for region_base, region_size in regions:
         try:
             buffer = pm.read_bytes(region_base, region_size)
-            for i in range(0, len(buffer) - 3, 4):
-                ptr_value = struct.unpack("<I", buffer[i : i + 4])[0]
-                if low <= ptr_value <= high:
-                    results.append((region_base + i, ptr_value, target_addr - ptr_value))
         except Exception:
-            pass
+            continue
+        ptrs = np.frombuffer(buffer, dtype="<u4", count=len(buffer) // 4)
+        idx = np.flatnonzero(_in_range_mask(ptrs, low, high))
+        for i, ptr_value in zip(idx.tolist(), ptrs[idx].tolist()):
+            results.append((region_base + i * 4, ptr_value, target_addr - ptr_value))
 
     return results
 
@@ -75,28 +88,28 @@ def find_pointers_to(pm, target_addr, search_range, regions):
 # ============================================================
 
 
-def find_all_hp_addrs(pm, hp_value):
+def iter_hp_addrs(pm, hp_value, cache=None):
     """Scan all readable memory for 4-byte-aligned int32 == hp_value.
-    Returns list of addresses."""
+
+    Yields the matching addresses as a list per region, as soon as that region
+    has been scanned.
+
+    cache: optional RegionCache so later passes reuse the region bytes.
+    """
     regions = get_memory_regions(pm.process_handle)
-    target_bytes = struct.pack("<i", hp_value)
-    addrs = []
+    read = cache.get if cache is not None else pm.read_bytes
+    target = np.int32(hp_value)
 
     for base, size in regions:
         try:
-            buffer = pm.read_bytes(base, size)
-            offset = 0
-            while True:
-                pos = buffer.find(target_bytes, offset)
-                if pos == -1:
-                    break
-                if pos % 4 == 0:
-                    addrs.append(base + pos)
-                offset = pos + 1
+            buffer = read(base, size)
         except Exception:
-            pass
-
-    return addrs
+            continue
+        # Aligned int32 view: every hit is 4-byte aligned by construction
+        words = np.frombuffer(buffer, dtype="<i4", count=len(buffer) // 4)
+        idx = np.flatnonzero(words == target)
+        if idx.size:
+            yield (base + idx * 4).tolist()
 
 
 # ============================================================
@@ -106,94 +119,202 @@ def find_all_hp_addrs(pm, hp_value):
 MAX_LEVELS = 5
 SEARCH_RANGE = 2048
 MAX_TARGETS_PER_LEVEL = 200
+# Up to this many targets, pointers are matched against each target's own window
+SMALL_TARGET_SET = 8
+# Regions are matched in blocks of this many bytes so the NumPy temporaries stay
+# cache-sized instead of scaling with multi-hundred-MB regions (multiple of 4)
+SCAN_CHUNK = 2 * 1024 * 1024
+
+
+def _in_range_mask(ptrs, low, high):
+    """Boolean mask of low <= ptrs <= high for a uint32 array.
 
+    Uses the unsigned wrap-around trick (ptrs - low) <= (high - low): one
+    subtraction and one comparison, so only a single uint32 temporary and
+    the result mask are allocated instead of two masks plus their AND.
+    """
+    low = max(low, 0)
+    if high < low:
+        return np.zeros(len(ptrs), dtype=bool)
+    return (ptrs - np.uint32(low)) <= np.uint32(high - low)
+
+
+_NO_MATCH = (np.empty(0, dtype=np.int64),) * 3
+
+
+def _match_pointers(buffer, target_addrs, global_low, global_high):
+    """Find every aligned uint32 in *buffer* that points into some target's window.
+
+    target_addrs: sorted int64 array of target addresses.  A pointer value p
+    matches target t when 0 <= t - p <= SEARCH_RANGE; one pointer may match
+    several targets.
 
-def reverse_scan_multi(pm, start_addrs):
+    Returns parallel int64 arrays (word_index, offset, target_index), one row
+    per match, in buffer order then target order — the same order as a
+    per-word Python scan.
+    """
+    ptrs = np.frombuffer(buffer, dtype="<u4", count=len(buffer) // 4)
+    if len(target_addrs) <= SMALL_TARGET_SET:
+        # Few targets (typical at deep levels): OR their own windows so pointers
+        # between widely spread targets are not picked up by the global bounds
+        mask = np.zeros(len(ptrs), dtype=bool)
+        for t in target_addrs.tolist():
+            mask |= _in_range_mask(ptrs, t - SEARCH_RANGE, t)
+    else:
+        mask = _in_range_mask(ptrs, global_low, global_high)
+    hit_idx = np.flatnonzero(mask)
+    if not hit_idx.size:
+        return _NO_MATCH
+    hit_vals = ptrs[hit_idx].astype(np.int64)
+
+    # Targets in [p, p + SEARCH_RANGE] form one contiguous run of the sorted array
+    lo = np.searchsorted(target_addrs, hit_vals, side="left")
+    hi = np.searchsorted(target_addrs, hit_vals + SEARCH_RANGE, side="right")
+    counts = hi - lo
+    keep = counts > 0
+    if not keep.any():
+        return _NO_MATCH
+    hit_idx, hit_vals, lo, counts = hit_idx[keep], hit_vals[keep], lo[keep], counts[keep]
+
+    # Expand each pointer into one row per matching target
+    word_idx = np.repeat(hit_idx, counts)
+    run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    tgt_idx = np.repeat(lo, counts) + (np.arange(len(word_idx)) - run_starts)
+    offsets = target_addrs[tgt_idx] - np.repeat(hit_vals, counts)
+    return word_idx, offsets, tgt_idx
+
+
+def _sorted_contains(sorted_arr, values):
+    """Vectorized membership test of *values* in the sorted unique array *sorted_arr*."""
+    if not sorted_arr.size:
+        return np.zeros(len(values), dtype=bool)
+    pos = np.searchsorted(sorted_arr, values)
+    return sorted_arr[np.minimum(pos, len(sorted_arr) - 1)] == values
+
+
+def _static_module_index(addrs, module_bases, module_ends):
+    """Vectorized is_static(): index into the base-sorted module arrays, or -1."""
+    pos = np.searchsorted(module_bases, addrs, side="right") - 1
+    inside = (pos >= 0) & (addrs < module_ends[np.maximum(pos, 0)])
+    return np.where(inside, pos, -1)
+
+
+def reverse_scan_multi(pm, start_addrs, cache=None):
     """BFS from multiple start addresses simultaneously back toward static bases.
 
     Reads memory only once per level, scanning for pointers to ALL targets at once.
     This is much faster than calling reverse_scan() for each address separately.
+    With a RegionCache, every region is read once for the whole BFS instead of
+    once per level.
+
+    Within a level, pointer hits stay in NumPy arrays (address, offset, index
+    of the target they lead to); offset lists are only built for chains that
+    reach a module or survive dedup into the next frontier.
 
     Returns list of chains.  Each chain is a dict:
         module: str          -- module name (e.g. "tthola.dat")
         module_offset: int   -- offset within module
-        offsets: list[int]   -- per-level offsets (from outermost to innermost)
+        offsets: tuple[int]  -- per-level offsets (from outermost to innermost)
         start_addr: int      -- which starting address this chain leads to
     """
     regions = get_memory_regions(pm.process_handle)
-    static_ranges = get_static_ranges(pm)
+    read = cache.get if cache is not None else pm.read_bytes
+    static_ranges = sorted(get_static_ranges(pm))
+    module_bases = np.array([r[0] for r in static_ranges], dtype=np.int64)
+    module_ends = np.array([r[1] for r in static_ranges], dtype=np.int64)
 
     # Each entry: (current_target_addr, offsets_so_far, original_start_addr)
-    current_targets = [(addr, [], addr) for addr in start_addrs]
+    current_targets = [(addr, (), addr) for addr in start_addrs]
     found_chains = []
+    # Every address already expanded as a target, across all levels and start points,
+    # kept sorted so membership is a vectorized binary search
+    visited = np.unique(np.asarray(start_addrs, dtype=np.int64))
 
     for level in range(MAX_LEVELS):
+        if not current_targets:
+            # A level that only reached static bases leaves nothing to expand
+            break
         print(f"    Level {level + 1}: scanning {len(current_targets)} targets ...", flush=True)
-        next_targets = []
 
-        # Build a single merged range covering all targets
-        # Group targets and scan memory once per region
-        target_list = [(addr, offsets, start) for addr, offsets, start in current_targets]
-
-        # Sort targets by address for efficient range checking
-        target_list.sort(key=lambda t: t[0])
+        # Sort targets by address for efficient range checking; target_list is
+        # the side table the per-hit target indices refer to
+        target_list = sorted(current_targets, key=lambda t: t[0])
         # Global min/max for quick rejection
         global_low = target_list[0][0] - SEARCH_RANGE
         global_high = target_list[-1][0]
 
+        target_addrs = np.array([t[0] for t in target_list], dtype=np.int64)
+        dyn_addrs, dyn_offsets, dyn_targets = [], [], []
+
         for region_base, region_size in regions:
             try:
-                buffer = pm.read_bytes(region_base, region_size)
+                buffer = read(region_base, region_size)
             except Exception:
                 continue
 
-            for i in range(0, len(buffer) - 3, 4):
-                ptr_value = struct.unpack("<I", buffer[i : i + 4])[0]
-                # Quick rejection using global bounds
-                if ptr_value < global_low or ptr_value > global_high:
+            view = memoryview(buffer)
+            for chunk_start in range(0, len(buffer), SCAN_CHUNK):
+                word_idx, offsets, tgt_idx = _match_pointers(
+                    view[chunk_start : chunk_start + SCAN_CHUNK],
+                    target_addrs,
+                    global_low,
+                    global_high,
+                )
+                if not word_idx.size:
                     continue
-
-                found_addr = region_base + i
-
-                # Check this pointer against all current targets
-                for target_addr, offsets_so_far, start in target_list:
-                    offset = target_addr - ptr_value
-                    if 0 <= offset <= SEARCH_RANGE:
-                        new_offsets = [offset] + offsets_so_far
-
-                        ok, module_name, module_offset = is_static(found_addr, static_ranges)
-                        if ok:
-                            found_chains.append(
-                                {
-                                    "module": module_name,
-                                    "module_offset": module_offset,
-                                    "offsets": new_offsets,
-                                    "start_addr": start,
-                                }
-                            )
-                        else:
-                            next_targets.append((found_addr, new_offsets, start))
-
-        # Deduplicate next targets by address (keep first occurrence)
-        seen = set()
-        unique = []
-        for addr, offsets, start in next_targets:
-            if addr not in seen:
-                seen.add(addr)
-                unique.append((addr, offsets, start))
-        next_targets = unique
+                found = region_base + chunk_start + word_idx * 4
+                mod_idx = _static_module_index(found, module_bases, module_ends)
+
+                is_static_hit = mod_idx >= 0
+                for j in np.flatnonzero(is_static_hit).tolist():
+                    _, offsets_so_far, start = target_list[tgt_idx[j]]
+                    base, _, module_name = static_ranges[mod_idx[j]]
+                    found_chains.append(
+                        {
+                            "module": module_name,
+                            "module_offset": int(found[j]) - base,
+                            "offsets": (int(offsets[j]),) + offsets_so_far,
+                            "start_addr": start,
+                        }
+                    )
+
+                dynamic = ~is_static_hit
+                dyn_addrs.append(found[dynamic])
+                dyn_offsets.append(offsets[dynamic])
+                dyn_targets.append(tgt_idx[dynamic])
+
+        # Deduplicate next targets by address (keep first occurrence, in scan order)
+        # and drop addresses already expanded at an earlier level (pointer cycles,
+        # parents shared between start points)
+        if dyn_addrs:
+            addrs = np.concatenate(dyn_addrs)
+            first = np.sort(np.unique(addrs, return_index=True)[1])
+            first = first[~_sorted_contains(visited, addrs[first])]
+        else:
+            addrs = first = np.empty(0, dtype=np.int64)
 
         static_count = len(found_chains)
         print(
-            f"    Level {level + 1}: {len(next_targets)} dynamic, {static_count} static chains found",
+            f"    Level {level + 1}: {len(first)} dynamic, {static_count} static chains found",
             flush=True,
         )
 
-        if not next_targets and not found_chains:
+        if not len(first) and not found_chains:
             print("    No more pointers to trace", flush=True)
             break
 
-        current_targets = next_targets[:MAX_TARGETS_PER_LEVEL]
+        # Materialise offset lists only for the frontier that is kept
+        keep = first[:MAX_TARGETS_PER_LEVEL]
+        if len(keep):
+            offsets = np.concatenate(dyn_offsets)[keep].tolist()
+            targets = np.concatenate(dyn_targets)[keep].tolist()
+        else:
+            offsets = targets = []
+        current_targets = []
+        visited = np.union1d(visited, addrs[keep])
+        for addr, offset, ti in zip(addrs[keep].tolist(), offsets, targets):
+            _, offsets_so_far, start = target_list[ti]
+            current_targets.append((addr, (offset,) + offsets_so_far, start))
 
     return found_chains
 
@@ -203,32 +324,59 @@ def reverse_scan_multi(pm, start_addrs):
 # ============================================================
 
 
-def resolve_chain_addr(pm, module_name, module_offset, offsets):
-    """Resolve a pointer chain and return the final address it points to, or None."""
-    try:
-        base_addr = None
-        for module in pm.list_modules():
-            if module.name == module_name:
-                base_addr = module.lpBaseOfDll + module_offset
-                break
-        if base_addr is None:
-            return None
+def resolve_chain_addrs(pm, module_bases, chains):
+    """Resolve many (module, module_offset, offsets) chains at once.
+
+    Chains are walked hop by hop in lockstep, so each hop level is a single
+    scatter_read() over every chain still alive instead of one read per chain
+    per hop; the pointer checks and offset additions for a hop are done on
+    arrays.  Returns a list of final addresses (or None) aligned with *chains*.
+    """
+    lengths = np.array([len(offsets) for _, _, offsets in chains], dtype=np.int64)
+    depth = int(lengths.max()) if len(chains) else 0
+    # Offsets padded into a (chain, hop) matrix; -1 marks a dead chain address
+    hop_offsets = np.zeros((len(chains), depth), dtype=np.int64)
+    addrs = np.full(len(chains), -1, dtype=np.int64)
+    for i, (module_name, module_offset, offsets) in enumerate(chains):
+        hop_offsets[i, : len(offsets)] = offsets
+        module_base = module_bases.get(module_name)
+        if module_base is not None:
+            addrs[i] = module_base + module_offset
+
+    for hop in range(depth):
+        active = np.flatnonzero((addrs >= 0) & (lengths > hop))
+        if not active.size:
+            break
+        raws = scatter_read(pm, addrs[active].tolist())
+        readable = np.array([raw is not None for raw in raws], dtype=bool)
+        addrs[active[~readable]] = -1
+        active = active[readable]
+        ptrs = np.frombuffer(b"".join(raw for raw in raws if raw is not None), dtype="<u4")
+        ptrs = ptrs.astype(np.int64)
+        valid = (ptrs != 0) & (ptrs <= 0x7FFFFFFF)
+        addrs[active[~valid]] = -1
+        active = active[valid]
+        addrs[active] = ptrs[valid] + hop_offsets[active, hop]
 
-        addr = base_addr
-        for off in offsets:
-            ptr = struct.unpack("<I", pm.read_bytes(addr, 4))[0]
-            if ptr == 0 or ptr > 0x7FFFFFFF:
-                return None
-            addr = ptr + off
+    return [None if addr < 0 else addr for addr in addrs.tolist()]
 
-        return addr
-    except Exception:
-        return None
+
+_KEY_HEADER = struct.Struct("<I")
 
 
 def chain_key(chain):
-    """Produce a hashable key for intersection: (module, module_offset, tuple(offsets))."""
-    return (chain["module"], chain["module_offset"], tuple(chain["offsets"]))
+    """Pack a chain into a flat bytes key for intersection: module name, NUL,
+    then uint32 module_offset and offsets.
+
+    Equal chains pack to equal bytes, and hashing one flat bytes object is
+    cheaper than hashing a nested tuple when intersecting large chain sets.
+    """
+    return (
+        chain["module"].encode()
+        + b"\0"
+        + _KEY_HEADER.pack(chain["module_offset"])
+        + array("I", chain["offsets"]).tobytes()
+    )
 
 
 # ============================================================
@@ -237,7 +385,8 @@ def chain_key(chain):
 
 
 def main():
-    sys.stdout.reconfigure(encoding="utf-8", line_buffering=True)
+    # No line buffering: long-running phases flush explicitly with flush=True
+    sys.stdout.reconfigure(encoding="utf-8")
 
     if len(sys.argv) < 3:
         print("Usage: uv run find_stable_chain.py <pid1>:<hp1> <pid2>:<hp2> [...]")
@@ -271,27 +420,34 @@ def main():
     per_process_data = []
 
     for i, (pid, hp) in enumerate(targets):
-        print(f"[{i + 1}/{len(targets)}] Connecting to PID {pid} ...")
+        print(f"[{i + 1}/{len(targets)}] Connecting to PID {pid} ...", flush=True)
         try:
             pm = pymem.Pymem(pid)
         except Exception as e:
             print(f"  [X] Cannot connect to PID {pid}: {e}")
             return
 
+        # One memory snapshot per process, shared by the HP scan and every BFS level
+        cache = RegionCache(pm)
+
         print(f"  Scanning for all addresses containing HP={hp} ...", flush=True)
         t0 = time.time()
-        hp_addrs = find_all_hp_addrs(pm, hp)
+        hp_addrs = []
+        # Print each region's hits while the scan continues, one write per region
+        for hits in iter_hp_addrs(pm, hp, cache):
+            hp_addrs.extend(hits)
+            sys.stdout.write("".join(f"    0x{a:08X}\n" for a in hits))
+            sys.stdout.flush()
         elapsed = time.time() - t0
         print(f"  [OK] Found {len(hp_addrs)} addresses ({elapsed:.1f}s)", flush=True)
-        for a in hp_addrs:
-            print(f"    0x{a:08X}", flush=True)
 
         # Run reverse BFS from ALL HP addresses simultaneously (single memory pass)
         print(
             f"  Running reverse pointer scan from {len(hp_addrs)} starting points ...", flush=True
         )
         t0 = time.time()
-        all_chains = reverse_scan_multi(pm, hp_addrs)
+        all_chains = reverse_scan_multi(pm, hp_addrs, cache)
+        del cache
         elapsed = time.time() - t0
         print(f"  [OK] Found {len(all_chains)} static chains total ({elapsed:.1f}s)", flush=True)
 
@@ -301,6 +457,7 @@ def main():
                 "hp": hp,
                 "hp_addrs": hp_addrs,
                 "pm": pm,
+                "module_bases": get_module_bases(pm),
                 "chains": all_chains,
             }
         )
@@ -308,23 +465,32 @@ def main():
 
     # Step 3: Intersect chains across all processes
     print("=" * 60)
-    print("Intersecting chains across processes ...")
+    print("Intersecting chains across processes ...", flush=True)
 
     if not per_process_data:
         print("[X] No process data")
         return
 
-    # Build set of chain keys for each process
+    # Build set of packed chain keys for each process; the first process also
+    # maps packed keys back to (module, module_offset, offsets) since the
+    # intersection can only contain its keys
     key_sets = []
-    for proc in per_process_data:
-        keys = set(chain_key(c) for c in proc["chains"])
+    unpacked = {}
+    for i, proc in enumerate(per_process_data):
+        keys = set()
+        for c in proc["chains"]:
+            packed = chain_key(c)
+            if i == 0 and packed not in keys:
+                unpacked[packed] = (c["module"], c["module_offset"], c["offsets"])
+            keys.add(packed)
         key_sets.append(keys)
         print(f"  PID {proc['pid']}: {len(keys)} unique chains")
 
     # Intersection
-    common_keys = key_sets[0]
+    common_packed = key_sets[0]
     for ks in key_sets[1:]:
-        common_keys = common_keys & ks
+        common_packed = common_packed & ks
+    common_keys = {unpacked[packed] for packed in common_packed}
 
     print(f"  Intersection: {len(common_keys)} chains survived")
     print()
@@ -340,25 +506,34 @@ def main():
         return
 
     # Step 4: Verify — resolve each surviving chain, classify as current/max HP
-    print("Verifying surviving chains ...")
+    print("Verifying surviving chains ...", flush=True)
     verified = []
+    sorted_keys = sorted(common_keys)
 
-    for key in sorted(common_keys):
+    # Resolve every chain per process up front: one batched read per hop level,
+    # then one batched read for the values the chains land on
+    per_process_values = []
+    for proc in per_process_data:
+        resolved = resolve_chain_addrs(proc["pm"], proc["module_bases"], sorted_keys)
+        raws = iter(scatter_read(proc["pm"], [a for a in resolved if a is not None]))
+        values = []
+        for resolved_addr in resolved:
+            raw = None if resolved_addr is None else next(raws)
+            values.append(None if raw is None else _INT32.unpack(raw)[0])
+        per_process_values.append((resolved, values, set(proc["hp_addrs"])))
+
+    for k, key in enumerate(sorted_keys):
         module, module_offset, offsets = key
         all_ok = True
         results = []
 
-        for proc in per_process_data:
-            resolved_addr = resolve_chain_addr(proc["pm"], module, module_offset, list(offsets))
+        for proc, (resolved, values, hp_addr_set) in zip(per_process_data, per_process_values):
+            resolved_addr = resolved[k]
+            hp_at_addr = values[k]
             if resolved_addr is None:
                 ok = False
-                hp_at_addr = None
             else:
-                try:
-                    hp_at_addr = proc["pm"].read_int(resolved_addr)
-                except Exception:
-                    hp_at_addr = None
-                ok = hp_at_addr == proc["hp"] or resolved_addr in proc["hp_addrs"]
+                ok = hp_at_addr == proc["hp"] or resolved_addr in hp_addr_set
             results.append((proc["pid"], proc["hp"], resolved_addr, hp_at_addr, ok))
             if not ok:
                 all_ok = False
@@ -378,24 +553,30 @@ def main():
     # Step 5: Classify each chain — does it point to current HP or max HP?
     # OOP sub-object layout: +0x130 = max HP, +0x140 = current HP (0x10 apart)
     # Check adjacent memory to determine which field the chain resolves to.
-    print("Classifying chains (current HP vs max HP) ...")
+    print("Classifying chains (current HP vs max HP) ...", flush=True)
     classified = []
 
-    for module, module_offset, offsets, results in verified:
+    # Verify already resolved every chain in every process (results[p][2]), so only
+    # each chain's [addr-0x10, addr+0x10] window is fetched, with one batched read
+    per_process_windows = [
+        scatter_read(
+            proc["pm"],
+            [results[p][2] - 0x10 for _, _, _, results in verified],
+            _HP_NEIGHBOURS.size,
+        )
+        for p, proc in enumerate(per_process_data)
+    ]
+
+    unpack_neighbours = _HP_NEIGHBOURS.unpack
+    for k, (module, module_offset, offsets, results) in enumerate(verified):
         field_votes = {"current_hp": 0, "max_hp": 0, "unknown": 0}
 
-        for proc in per_process_data:
-            resolved_addr = resolve_chain_addr(proc["pm"], module, module_offset, list(offsets))
-            if resolved_addr is None:
-                field_votes["unknown"] += 1
-                continue
-            try:
-                val_here = proc["pm"].read_int(resolved_addr)
-                val_plus16 = proc["pm"].read_int(resolved_addr + 0x10)
-                val_minus16 = proc["pm"].read_int(resolved_addr - 0x10)
-            except Exception:
+        for windows in per_process_windows:
+            raw = windows[k]
+            if raw is None:
                 field_votes["unknown"] += 1
                 continue
+            val_minus16, val_here, val_plus16 = unpack_neighbours(raw)
 
             # If [addr+0x10] is a valid HP-like value and >= val_here → we're at max HP
             # (max HP is before current HP in the struct: +0x130=max, +0x140=current)
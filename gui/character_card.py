@@ -1,36 +1,125 @@
 """Read-only character card widget for the By Char view in InventoryManagerTab."""
 
+from functools import cache
+
 from PySide6.QtWidgets import (
     QFrame,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
 
 from gui.snapshot_db import SnapshotDB
 from gui.i18n import t
 
 
-class _NumericItem(QTableWidgetItem):
-    """QTableWidgetItem that sorts numerically instead of lexicographically."""
+_ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+_ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+# Row dict key shown in each column; item id and quantity are numeric
+_FIELDS = ("item_id", "name", "qty", "source")
+_NUMERIC_COLUMNS = frozenset({0, 2})
+# Default parent for rowCount/columnCount: the invalid root index
+_ROOT = QModelIndex()
+# Raw values for sorting, so numeric columns sort as numbers
+SORT_ROLE = Qt.ItemDataRole.UserRole
+
+
+def _row_keys(rows: list[dict]) -> list[tuple]:
+    """Stable identity per row: (source, item_id, n) where n counts repeats of the
+    same item in one source (unstacked slots)."""
+    seen: dict[tuple, int] = {}
+    keys = []
+    for r in rows:
+        base = (r["source"], r["item_id"])
+        n = seen.get(base, 0)
+        seen[base] = n + 1
+        keys.append(base + (n,))
+    return keys
+
 
-    def __lt__(self, other: "QTableWidgetItem") -> bool:
-        try:
-            return float(self.text()) < float(other.text())
-        except ValueError:
-            return super().__lt__(other)
+def _row_texts(r: dict) -> tuple[str, ...]:
+    """Display strings for one row, in column order."""
+    return tuple(str(r[f]) if col in _NUMERIC_COLUMNS else r[f] for col, f in enumerate(_FIELDS))
 
 
-CARD_COLUMNS = [
-    t("mgr_col_item_id"),
-    t("mgr_col_name"),
-    t("mgr_col_qty"),
-    t("mgr_col_source"),
-]
+@cache
+def card_columns() -> tuple[str, ...]:
+    """Column header labels, translated on first use rather than at import."""
+    return (
+        t("mgr_col_item_id"),
+        t("mgr_col_name"),
+        t("mgr_col_qty"),
+        t("mgr_col_source"),
+    )
+
+
+class CardModel(QAbstractTableModel):
+    """Table model over one character's item rows.
+
+    Rows stay as the dicts loaded from the DB; their display strings are
+    converted once per row when rows are set, not on every data() call.
+    """
+
+    def __init__(self, rows: list[dict], parent=None):
+        super().__init__(parent)
+        self._rows = list(rows)
+        self._keys = _row_keys(self._rows)
+        self._texts = [_row_texts(r) for r in self._rows]
+
+    def rowCount(self, parent=_ROOT) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=_ROOT) -> int:
+        return 0 if parent.isValid() else len(_FIELDS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._texts[index.row()][col]
+        if role == SORT_ROLE:
+            return self._rows[index.row()][_FIELDS[col]]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return _ALIGN_RIGHT if col in _NUMERIC_COLUMNS else _ALIGN_LEFT
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return card_columns()[section]
+        return None
+
+    def set_rows(self, rows: list[dict]) -> None:
+        """Replace the rows, emitting only the removals, changes and insertions
+        between the old and new sets (rows are matched by _row_keys)."""
+        new = dict(zip(_row_keys(rows), rows))
+
+        for i in range(len(self._keys) - 1, -1, -1):
+            if self._keys[i] not in new:
+                self.beginRemoveRows(QModelIndex(), i, i)
+                del self._keys[i]
+                del self._rows[i]
+                del self._texts[i]
+                self.endRemoveRows()
+
+        for i, key in enumerate(self._keys):
+            r = new.pop(key)
+            if r != self._rows[i]:
+                self._rows[i] = r
+                self._texts[i] = _row_texts(r)
+                self.dataChanged.emit(self.index(i, 0), self.index(i, len(_FIELDS) - 1))
+
+        if new:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new) - 1)
+            self._keys.extend(new)
+            self._rows.extend(new.values())
+            self._texts.extend(_row_texts(r) for r in new.values())
+            self.endInsertRows()
 
 
 class CharacterCard(QFrame):
@@ -54,18 +143,18 @@ class CharacterCard(QFrame):
         header_layout.setContentsMargins(16, 10, 12, 10)
         header_layout.setSpacing(8)
 
+        # Styled by the app-wide theme QSS (QLabel#char_card_*), so creating a
+        # card does not parse a stylesheet per label
         self._name_lbl = QLabel(character)
-        self._name_lbl.setStyleSheet(
-            "color: #F8FAFC; font-weight: 700; padding: 2px 8px;"
-        )
+        self._name_lbl.setObjectName("char_card_name")
         header_layout.addWidget(self._name_lbl)
 
         self._acct_lbl = QLabel()
-        self._acct_lbl.setStyleSheet("color: #475569; font-size: 9pt; padding: 0 6px;")
+        self._acct_lbl.setObjectName("char_card_account")
         header_layout.addWidget(self._acct_lbl)
 
         self._time_lbl = QLabel()
-        self._time_lbl.setStyleSheet("color: #94A3B8; font-size: 9pt; padding: 0 6px;")
+        self._time_lbl.setObjectName("char_card_time")
         header_layout.addWidget(self._time_lbl)
 
         header_layout.addStretch()
@@ -73,13 +162,22 @@ class CharacterCard(QFrame):
         outer.addWidget(header_frame)
 
         # ── Item table ───────────────────────────────────────────────────
-        self._table = QTableWidget(0, len(CARD_COLUMNS))
-        self._table.setHorizontalHeaderLabels(CARD_COLUMNS)
+        self._model = CardModel(rows, self)
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self._proxy.setSortRole(SORT_ROLE)
+
+        self._table = QTableView()
+        self._table.setModel(self._proxy)
         self._table.horizontalHeader().setSectionResizeMode(
             1, QHeaderView.ResizeMode.Stretch
         )
         self._table.verticalHeader().setVisible(False)
-        self._table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # Every row has the style's default height and no cell wraps, so the
+        # view never measures row contents
+        self._table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self._table.setWordWrap(False)
+        self._table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self._table.setAlternatingRowColors(True)
         self._table.setSortingEnabled(True)
         # Disable internal scrollbar — height will be fixed
@@ -88,10 +186,12 @@ class CharacterCard(QFrame):
 
         outer.addWidget(self._table)
 
-        self._populate(rows)
+        self._update_badges(rows)
+        # Fix table height so no internal scrollbar is needed
+        self._adjust_table_height()
 
-    def _populate(self, rows: list[dict]) -> None:
-        """Fill account badge, time badge, and table rows."""
+    def _update_badges(self, rows: list[dict]) -> None:
+        """Fill account badge and time badge."""
         # Account badge
         acct = self._db.get_character_account(self._character)
         acct_name = acct["name"] if acct else t("no_account")
@@ -101,30 +201,21 @@ class CharacterCard(QFrame):
         latest = max((r["scanned_at"] for r in rows), default="")
         self._time_lbl.setText(f"· {latest[:16]}" if latest else "")
 
-        # Fill table
-        self._table.setSortingEnabled(False)
-        self._table.setRowCount(len(rows))
-        for i, r in enumerate(rows):
-            values = [str(r["item_id"]), r["name"], str(r["qty"]), r["source"]]
-            for col, val in enumerate(values):
-                item = _NumericItem(val) if col in (0, 2) else QTableWidgetItem(val)
-                align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
-                if col in (0, 2):
-                    align = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-                item.setTextAlignment(align)
-                self._table.setItem(i, col, item)
-        self._table.setSortingEnabled(True)
-
-        # Fix table height so no internal scrollbar is needed
-        self._adjust_table_height()
-
     def _adjust_table_height(self) -> None:
         """Set table to exact content height (header + all rows)."""
         header_h = self._table.horizontalHeader().height()
-        row_h = sum(self._table.rowHeight(i) for i in range(self._table.rowCount()))
+        row_h = self._table.verticalHeader().length()
         self._table.setFixedHeight(header_h + row_h + 2)
 
     def update_rows(self, rows: list[dict]) -> None:
-        """Refresh card with new rows."""
+        """Refresh card with new rows.
+
+        The model applies only the differences, so unchanged rows, the sort
+        order and the selection are kept.
+        """
+        old_count = self._model.rowCount()
         self._rows = rows
-        self._populate(rows)
+        self._update_badges(rows)
+        self._model.set_rows(rows)
+        if self._model.rowCount() != old_count:
+            self._adjust_table_height()
@@ -3,6 +3,8 @@ Per-character panel: op_bar + vitals strip + inner tabs.
 One instance per detected game window.
 """
 
+from collections.abc import Callable
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -18,7 +20,7 @@ from PySide6.QtGui import QIntValidator
 from PySide6.QtCore import Qt, QTimer, Slot, Signal
 
 from gui.process_detector import bring_window_to_front
-from gui.worker import ReaderWorker
+from gui.worker import ReaderWorker, Stats
 from gui.status_tab import StatusTab
 from gui.inventory_tab import InventoryTab
 from gui.warehouse_tab import WarehouseTab
@@ -29,6 +31,9 @@ from gui.theme import badge_style, vital_html, fraction_html, GREEN, BLUE, AMBER
 from gui.i18n import t
 from reader import resolve_filters
 
+# Minimum interval between GUI refreshes driven by stats_updated
+STATS_COALESCE_MS = 33
+
 
 def _vsep() -> QFrame:
     f = QFrame()
@@ -39,6 +44,11 @@ def _vsep() -> QFrame:
     return f
 
 
+def _snapshot_rows(items: list[tuple]) -> list[dict]:
+    """Map worker (item_id, qty, name) tuples to SnapshotDB.save_snapshot rows."""
+    return [{"item_id": iid, "qty": qty} for iid, qty, _ in items]
+
+
 class CharacterPanel(QWidget):
     # Emitted when the character name becomes known — used to rename the outer tab.
     tab_label_changed = Signal(str)
@@ -54,8 +64,23 @@ class CharacterPanel(QWidget):
         self._snapshot_db = snapshot_db
         self._pending_hp: tuple[int, dict | None, bool] | None = None
         self._current_character: str = ""
-        self._last_inventory: list[dict] = []
-        self._last_warehouse: list[dict] = []
+        # Last scan results as emitted by the worker: (item_id, qty, name) tuples.
+        # Converted to snapshot rows only when the user saves.
+        self._last_inventory: list[tuple] = []
+        self._last_warehouse: list[tuple] = []
+        # Last text pushed to each vitals label and the last stats fields
+        # forwarded to the status tab, so unchanged ticks skip the Qt calls.
+        self._last_vital_text: dict[str, str] = {}
+        self._last_stats_fields: tuple | None = None
+        self._pending_status_fields: list | None = None
+
+        # Bursts of stats ticks collapse into one GUI refresh per interval;
+        # only the newest Stats is kept.
+        self._pending_stats: Stats | None = None
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(STATS_COALESCE_MS)
+        self._coalesce_timer.timeout.connect(self._flush_stats)
 
         self._fake_active = FakeActiveKeeper()
 
@@ -93,7 +118,8 @@ class CharacterPanel(QWidget):
         op_layout.addWidget(self._connect_btn)
 
         self._state_indicator = QLabel(t("state_DISCONNECTED"))
-        self._state_indicator.setStyleSheet(badge_style("DISCONNECTED"))
+        self._last_badge_css = badge_style("DISCONNECTED")
+        self._state_indicator.setStyleSheet(self._last_badge_css)
         op_layout.addWidget(self._state_indicator)
 
         op_layout.addStretch()
@@ -181,26 +207,67 @@ class CharacterPanel(QWidget):
         root.addWidget(vitals_frame)
 
         # ── inner tabs ────────────────────────────────────────────────
+        # Only the status tab is built up front; the others start as empty
+        # placeholders and are constructed the first time they are shown.
         self._tabs = QTabWidget()
         self._status_tab = StatusTab()
-        self._inventory_tab = InventoryTab()
-        self._warehouse_tab = WarehouseTab()
-        self._auto_click_tab = AutoClickTab(hwnd=hwnd)
+        self._inventory_tab: InventoryTab | None = None
+        self._warehouse_tab: WarehouseTab | None = None
+        self._auto_click_tab: AutoClickTab | None = None
 
         self._tabs.addTab(self._status_tab, t("tab_status"))
-        self._tabs.addTab(self._inventory_tab, t("tab_inventory"))
-        self._tabs.addTab(self._warehouse_tab, t("tab_warehouse"))
-        self._tabs.addTab(self._auto_click_tab, t("tab_auto_click"))
+        self._tabs.addTab(QWidget(), t("tab_inventory"))
+        self._tabs.addTab(QWidget(), t("tab_warehouse"))
+        self._tabs.addTab(QWidget(), t("tab_auto_click"))
+        self._tab_factories: dict[int, Callable[[], QWidget]] = {
+            1: self._build_inventory_tab,
+            2: self._build_warehouse_tab,
+            3: self._build_auto_click_tab,
+        }
+        self._tabs.currentChanged.connect(self._on_tab_changed)
         root.addWidget(self._tabs)
 
+        # Auto-connect using stable pointer chain (no HP input needed)
+        QTimer.singleShot(100, self._auto_connect)
+
+    # ------------------------------------------------------------------
+    # Lazy inner tabs
+    # ------------------------------------------------------------------
+    def _build_inventory_tab(self) -> InventoryTab:
+        self._inventory_tab = InventoryTab()
         self._inventory_tab.scan_requested.connect(self._on_inventory_scan)
-        self._warehouse_tab.scan_requested.connect(self._on_warehouse_scan)
-        self._auto_click_tab.status_message.connect(self.status_message)
         self._inventory_tab.save_requested.connect(self._on_inventory_save)
+        return self._inventory_tab
+
+    def _build_warehouse_tab(self) -> WarehouseTab:
+        self._warehouse_tab = WarehouseTab()
+        self._warehouse_tab.scan_requested.connect(self._on_warehouse_scan)
         self._warehouse_tab.save_requested.connect(self._on_warehouse_save)
+        return self._warehouse_tab
 
-        # Auto-connect using stable pointer chain (no HP input needed)
-        QTimer.singleShot(100, self._auto_connect)
+    def _build_auto_click_tab(self) -> AutoClickTab:
+        self._auto_click_tab = AutoClickTab(hwnd=self._hwnd)
+        self._auto_click_tab.status_message.connect(self.status_message)
+        return self._auto_click_tab
+
+    @Slot(int)
+    def _on_tab_changed(self, index: int):
+        if self._tabs.widget(index) is self._status_tab:
+            if self._pending_status_fields is not None:
+                self._update_status_tab(self._pending_status_fields)
+            return
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+        label = self._tabs.tabText(index)
+        placeholder = self._tabs.widget(index)
+        # Swapping the page would itself emit currentChanged
+        self._tabs.blockSignals(True)
+        self._tabs.removeTab(index)
+        self._tabs.insertTab(index, factory(), label)
+        self._tabs.setCurrentIndex(index)
+        self._tabs.blockSignals(False)
+        placeholder.deleteLater()
 
     # ------------------------------------------------------------------
     # Slots
@@ -256,7 +323,11 @@ class CharacterPanel(QWidget):
     @Slot(str)
     def _on_state_changed(self, state: str):
         self._state_indicator.setText(t(f"state_{state}"))
-        self._state_indicator.setStyleSheet(badge_style(state))
+        # Re-setting an identical stylesheet still re-polishes the widget
+        css = badge_style(state)
+        if css != self._last_badge_css:
+            self._last_badge_css = css
+            self._state_indicator.setStyleSheet(css)
         self._relocate_btn.setEnabled(state == "LOCATED")
         if state == "DISCONNECTED":
             if self._pending_hp is not None:
@@ -271,51 +342,70 @@ class CharacterPanel(QWidget):
             self._connect_btn.setEnabled(False)
             self._fake_active.start(self._hwnd)
 
-    @Slot(list)
-    def _on_stats_updated(self, fields: list):
-        data = dict(fields)
+    @Slot(object)
+    def _on_stats_updated(self, stats: Stats):
+        self._pending_stats = stats
+        if not self._coalesce_timer.isActive():
+            self._coalesce_timer.start()
+
+    @Slot()
+    def _flush_stats(self):
+        stats = self._pending_stats
+        if stats is None:
+            return
+        self._pending_stats = None
         # Only update character name on first occurrence (name is stable for a session).
-        # Uses empty-string fallback so a transient missing field does not clear the stored name.
-        name = data.get("角色名稱", "")
+        # A transient missing name does not clear the stored one.
+        name = stats.name
         if name and name != self._current_character:
             self._current_character = name
             self.tab_label_changed.emit(name)
 
-        hp = data.get("血量", "---")
-        hp_max = data.get("最大血量", "---")
-        mp = data.get("真氣", "---")
-        mp_max = data.get("最大真氣", "---")
-        wt = data.get("負重", "---")
-        wt_max = data.get("最大負重", "---")
-        lv = data.get("等級", "---")
-        x = data.get("X座標", "---")
-        y = data.get("Y座標", "---")
-        map_name = data.get("地圖名稱", "")
-
-        self._vitals_labels["Lv"].setText(vital_html(t("vital_lv"), lv))
-        self._vitals_labels["HP"].setText(fraction_html(t("vital_hp"), hp, hp_max, GREEN))
-        self._vitals_labels["MP"].setText(fraction_html(t("vital_mp"), mp, mp_max, BLUE))
-        self._vitals_labels["Weight"].setText(fraction_html(t("vital_wt"), wt, wt_max, AMBER))
-        pos_str = f"{map_name} ({x}, {y})" if map_name else f"({x}, {y})"
-        self._vitals_labels["Pos"].setText(vital_html(t("vital_pos"), pos_str))
-
-        self._status_tab.update_stats(fields)
+        self._set_vital("Lv", vital_html(t("vital_lv"), stats.lv))
+        self._set_vital("HP", fraction_html(t("vital_hp"), stats.hp, stats.hp_max, GREEN))
+        self._set_vital("MP", fraction_html(t("vital_mp"), stats.mp, stats.mp_max, BLUE))
+        self._set_vital("Weight", fraction_html(t("vital_wt"), stats.wt, stats.wt_max, AMBER))
+        map_name = stats.map_name
+        pos_str = f"{map_name} ({stats.x}, {stats.y})" if map_name else f"({stats.x}, {stats.y})"
+        self._set_vital("Pos", vital_html(t("vital_pos"), pos_str))
+
+        # The status tab is only updated while it is shown; otherwise the newest
+        # fields wait until it becomes the current tab again.
+        if self._tabs.currentWidget() is self._status_tab:
+            self._update_status_tab(stats.fields)
+        else:
+            self._pending_status_fields = stats.fields
+
+    def _update_status_tab(self, fields: list):
+        self._pending_status_fields = None
+        fields_key = tuple(fields)
+        if fields_key != self._last_stats_fields:
+            self._last_stats_fields = fields_key
+            self._status_tab.update_stats(fields)
+
+    def _set_vital(self, key: str, text: str):
+        """Set a vitals label's text, skipping the call when it is unchanged."""
+        if self._last_vital_text.get(key) != text:
+            self._last_vital_text[key] = text
+            self._vitals_labels[key].setText(text)
 
     @Slot(list)
     def _on_inventory_ready(self, items: list):
         self._inventory_tab.populate(items)
-        self._last_inventory = [{"item_id": iid, "qty": qty} for iid, qty, _ in items]
+        self._last_inventory = items
 
     @Slot(list)
     def _on_warehouse_ready(self, items: list):
         self._warehouse_tab.populate(items)
-        self._last_warehouse = [{"item_id": iid, "qty": qty} for iid, qty, _ in items]
+        self._last_warehouse = items
 
     @Slot(str)
     def _on_scan_error(self, msg: str):
         self.status_message.emit(t("scan_error", msg=msg), 5000)
-        self._inventory_tab.set_scanning(False)
-        self._warehouse_tab.set_scanning(False)
+        if self._inventory_tab is not None:
+            self._inventory_tab.set_scanning(False)
+        if self._warehouse_tab is not None:
+            self._warehouse_tab.set_scanning(False)
 
     @Slot()
     def _on_inventory_scan(self):
@@ -333,7 +423,7 @@ class CharacterPanel(QWidget):
             self.status_message.emit(t("no_inventory_to_save"), 3000)
             return
         saved = self._snapshot_db.save_snapshot(
-            self._current_character, "inventory", self._last_inventory
+            self._current_character, "inventory", _snapshot_rows(self._last_inventory)
         )
         msg = t("snapshot_saved") if saved else t("snapshot_no_change")
         self.status_message.emit(msg, 3000)
@@ -345,7 +435,7 @@ class CharacterPanel(QWidget):
             self.status_message.emit(t("no_warehouse_to_save"), 3000)
             return
         saved = self._snapshot_db.save_snapshot(
-            self._current_character, "warehouse", self._last_warehouse
+            self._current_character, "warehouse", _snapshot_rows(self._last_warehouse)
         )
         msg = t("snapshot_saved") if saved else t("snapshot_no_change")
         self.status_message.emit(msg, 3000)
@@ -387,8 +477,10 @@ class CharacterPanel(QWidget):
 
     def shutdown(self):
         """Stop the worker thread, auto-click timer, and fake active hook."""
+        self._coalesce_timer.stop()
         self._fake_active.stop()
-        self._auto_click_tab.shutdown()
+        if self._auto_click_tab is not None:
+            self._auto_click_tab.shutdown()
         self._worker.stop()
         if not self._worker.wait(5000):  # 5-second timeout
             self._worker.terminate()  # last resort if worker is stuck
@@ -7,10 +7,17 @@ from pathlib import Path
 _DEFAULT_PATH = Path(__file__).parent.parent / "config.json"
 
 
+# Parsed config.json contents per path, filled by load_theme/save_theme so a
+# save does not have to re-read and re-parse the file it last saw.
+_cache: dict[Path, dict] = {}
+
+
 def load_theme(path: Path = _DEFAULT_PATH) -> str:
     """Return saved theme ('dark' or 'light'). Falls back to 'dark'."""
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(data, dict):
+            _cache[path] = data
         value = data.get("theme", "dark")
         return value if value in ("dark", "light") else "dark"
     except Exception:
@@ -22,13 +29,16 @@ def save_theme(mode: str, path: Path = _DEFAULT_PATH) -> None:
     if mode not in ("dark", "light"):
         raise ValueError(f"Invalid theme: {mode!r}. Expected 'dark' or 'light'.")
     try:
-        existing: dict = {}
-        if path.exists():
+        existing = _cache.get(path)
+        if existing is None:
             try:
                 existing = json.loads(path.read_text(encoding="utf-8"))
             except Exception:
-                pass
+                existing = {}
+            if not isinstance(existing, dict):
+                existing = {}
         existing["theme"] = mode
         path.write_text(json.dumps(existing, indent=2, ensure_ascii=False), encoding="utf-8")
+        _cache[path] = existing
     except Exception as e:
         print(f"[config] Failed to save theme: {e}", file=sys.stderr)
@@ -1,6 +1,15 @@
 """Data Management tab: master-detail view for characters, snapshots, and accounts."""
 
-from PySide6.QtCore import Qt, Signal
+from collections.abc import Callable
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QEvent,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+    Signal,
+)
 from PySide6.QtWidgets import (
     QComboBox,
     QFrame,
@@ -15,8 +24,10 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QSplitter,
     QStackedWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QTableView,
     QTreeWidget,
     QTreeWidgetItem,
     QVBoxLayout,
@@ -35,6 +46,126 @@ def _section_label(text: str) -> QLabel:
     return lbl
 
 
+# Column holding the painted delete button in the snapshot history table
+_DELETE_COLUMN = 3
+# Root index of the flat snapshot model
+_ROOT = QModelIndex()
+
+
+class _SnapshotsModel(QAbstractTableModel):
+    """Table model over a character's snapshot rows (source, time, qty, delete)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[dict] = []
+        self._headers = [t("mgr_col_source"), t("mgr_col_snapshot_time"), t("mgr_col_qty"), ""]
+        self._delete_text = t("delete_snapshot")
+
+    def rowCount(self, parent=_ROOT) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=_ROOT) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        snap = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return snap["source_label"]
+            if col == 1:
+                return snap["scanned_at"]
+            if col == 2:
+                return str(snap["item_count"])
+            return self._delete_text
+        if role == Qt.ItemDataRole.UserRole:
+            return snap["id"]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def set_rows(self, snapshots: list[dict]) -> None:
+        """Replace all rows; each snapshot dict gains a translated source_label."""
+        src = {
+            "inventory": t("source_inventory"),
+            "warehouse": t("source_warehouse"),
+        }
+        self.beginResetModel()
+        self._rows = [
+            {**snap, "source_label": src.get(snap["source"], snap["source"])} for snap in snapshots
+        ]
+        self.endResetModel()
+
+
+class _DeleteButtonDelegate(QStyledItemDelegate):
+    """Paints a push button in the delete column and reports clicks on it.
+
+    Replaces a real QPushButton per row, so refreshing the table creates no widgets.
+    Buttons are drawn through one hidden QPushButton named delete_btn, so the
+    theme's QPushButton rules (including #delete_btn, :hover and :pressed) style
+    them like real buttons. Space on the focused cell presses the button too.
+    """
+
+    delete_requested = Signal(int)  # snapshot id
+
+    def __init__(self, view: QTableView):
+        super().__init__(view)
+        self._view = view
+        # Style target only, never shown
+        self._style_button = QPushButton(view)
+        self._style_button.setObjectName("delete_btn")
+        self._style_button.hide()
+        # Cell whose button is held down by the mouse
+        self._pressed = QPersistentModelIndex()
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.initFrom(self._style_button)
+        button.rect = option.rect.adjusted(4, 3, -4, -3)
+        button.text = index.data(Qt.ItemDataRole.DisplayRole)
+        button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            button.state |= QStyle.StateFlag.State_MouseOver
+        if option.state & QStyle.StateFlag.State_HasFocus:
+            button.state |= QStyle.StateFlag.State_HasFocus
+        if self._pressed == index:
+            button.state |= QStyle.StateFlag.State_Sunken
+        self._style_button.ensurePolished()
+        self._style_button.style().drawControl(
+            QStyle.ControlElement.CE_PushButton, button, painter, self._style_button
+        )
+
+    def editorEvent(self, event, model, option, index):
+        etype = event.type()
+        if etype == QEvent.Type.KeyPress and event.key() == Qt.Key.Key_Space:
+            self.delete_requested.emit(index.data(Qt.ItemDataRole.UserRole))
+            return True
+        if etype not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease):
+            return super().editorEvent(event, model, option, index)
+        if event.button() != Qt.MouseButton.LeftButton:
+            return super().editorEvent(event, model, option, index)
+
+        inside = option.rect.contains(event.position().toPoint())
+        if etype == QEvent.Type.MouseButtonPress:
+            if not inside:
+                return super().editorEvent(event, model, option, index)
+            self._pressed = QPersistentModelIndex(index)
+            self._view.viewport().update(option.rect)
+            return True
+
+        was_pressed = self._pressed == index
+        self._pressed = QPersistentModelIndex()
+        self._view.viewport().update(option.rect)
+        if inside and was_pressed:
+            self.delete_requested.emit(index.data(Qt.ItemDataRole.UserRole))
+        return True
+
+
 class _CharDetailPanel(QWidget):
     """Detail panel showing account assignment, snapshot history, and delete options."""
 
@@ -45,6 +176,8 @@ class _CharDetailPanel(QWidget):
         super().__init__(parent)
         self._db = db
         self._character: str | None = None
+        # (character, SnapshotDB.snapshots_key) of the rows shown in the table
+        self._table_key: tuple = (None, None)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -71,18 +204,26 @@ class _CharDetailPanel(QWidget):
         # ── Snapshot history section ──────────────────────────────────────
         layout.addWidget(_section_label(t("snapshot_history")))
 
-        self._snap_table = QTableWidget(0, 4)
-        self._snap_table.setHorizontalHeaderLabels(
-            [t("mgr_col_source"), t("mgr_col_snapshot_time"), t("mgr_col_qty"), ""]
-        )
+        self._snap_model = _SnapshotsModel(self)
+        self._snap_table = QTableView()
+        self._snap_table.setModel(self._snap_model)
+        self._delete_delegate = _DeleteButtonDelegate(self._snap_table)
+        self._snap_table.setItemDelegateForColumn(_DELETE_COLUMN, self._delete_delegate)
+        # Hover events let the view repaint the painted buttons' :hover state
+        self._snap_table.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
         hdr = self._snap_table.horizontalHeader()
         hdr.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         hdr.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         hdr.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        hdr.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
-        self._snap_table.setColumnWidth(3, 72)
-        self._snap_table.verticalHeader().setVisible(False)
-        self._snap_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        hdr.setSectionResizeMode(_DELETE_COLUMN, QHeaderView.ResizeMode.Fixed)
+        self._snap_table.setColumnWidth(_DELETE_COLUMN, 72)
+        vhdr = self._snap_table.verticalHeader()
+        vhdr.setVisible(False)
+        # Every row has the same fixed height, tall enough for the painted delete
+        # button (min-height 24 + padding), so rows are never measured
+        vhdr.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vhdr.setDefaultSectionSize(34)
+        self._snap_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self._snap_table.setWordWrap(False)
         layout.addWidget(self._snap_table)
 
@@ -107,6 +248,7 @@ class _CharDetailPanel(QWidget):
         self._acct_combo.currentIndexChanged.connect(self._on_account_changed)
         self._create_acct_btn.clicked.connect(self._on_create_account)
         self._delete_char_btn.clicked.connect(self._on_delete_character)
+        self._delete_delegate.delete_requested.connect(self._on_delete_snapshot)
 
     # ── Public API ────────────────────────────────────────────────────────
 
@@ -114,22 +256,30 @@ class _CharDetailPanel(QWidget):
         """Load data for the given character."""
         self._character = character
         self._title_lbl.setText(character)
-        self._refresh_combo()
-        self._refresh_table()
+        # The table is only rebuilt when this character's snapshots changed;
+        # reloads after account edits leave it untouched.
+        known = self._table_key[1] if self._table_key[0] == character else None
+        accounts, account, key, snapshots = self._db.load_detail(character, known)
+        self._apply_combo(accounts, account)
+        if snapshots is not None:
+            self._table_key = (character, key)
+            self._snap_model.set_rows(snapshots)
 
     # ── Private helpers ───────────────────────────────────────────────────
 
     def _refresh_combo(self) -> None:
+        current = self._db.get_character_account(self._character) if self._character else None
+        self._apply_combo(self._db.list_accounts(), current)
+
+    def _apply_combo(self, accounts: list[dict], current: dict | None) -> None:
         self._acct_combo.blockSignals(True)
         self._acct_combo.clear()
         self._acct_combo.addItem(t("no_account"), userData=None)
 
-        accounts = self._db.list_accounts()
         for acct in accounts:
             self._acct_combo.addItem(acct["name"], userData=acct["id"])
 
         # Select current account
-        current = self._db.get_character_account(self._character) if self._character else None
         if current is not None:
             for i in range(self._acct_combo.count()):
                 if self._acct_combo.itemData(i) == current["id"]:
@@ -143,39 +293,8 @@ class _CharDetailPanel(QWidget):
     def _refresh_table(self) -> None:
         if self._character is None:
             return
-        _src = {
-            "inventory": t("source_inventory"),
-            "warehouse": t("source_warehouse"),
-        }
-        snapshots = self._db.list_all_snapshots(self._character)
-        self._snap_table.setRowCount(len(snapshots))
-        for row, snap in enumerate(snapshots):
-            src_label = _src.get(snap["source"], snap["source"])
-            self._snap_table.setItem(row, 0, QTableWidgetItem(src_label))
-            self._snap_table.setItem(row, 1, QTableWidgetItem(snap["scanned_at"]))
-            self._snap_table.setItem(row, 2, QTableWidgetItem(str(snap["item_count"])))
-
-            # Wrap button in a container widget so it doesn't bleed over cell borders
-            del_btn = QPushButton(t("delete_snapshot"))
-            del_btn.setObjectName("delete_btn")
-            snap_id = snap["id"]
-            del_btn.clicked.connect(
-                lambda checked=False, sid=snap_id: self._on_delete_snapshot(sid)
-            )
-            cell_widget = QWidget()
-            cell_layout = QHBoxLayout(cell_widget)
-            cell_layout.setContentsMargins(4, 3, 4, 3)
-            cell_layout.setSpacing(0)
-            cell_layout.addWidget(del_btn)
-            self._snap_table.setCellWidget(row, 3, cell_widget)
-
-        self._snap_table.resizeRowsToContents()
-        # resizeRowsToContents ignores cellWidgets; ensure each row is tall
-        # enough to fully display the delete button (min-height 24 + padding).
-        min_row_height = 60
-        for row in range(self._snap_table.rowCount()):
-            if self._snap_table.rowHeight(row) < min_row_height:
-                self._snap_table.setRowHeight(row, min_row_height)
+        self._table_key = (self._character, self._db.snapshots_key(self._character))
+        self._snap_model.set_rows(self._db.list_all_snapshots(self._character))
 
     # ── Slots ─────────────────────────────────────────────────────────────
 
@@ -209,15 +328,36 @@ class _CharDetailPanel(QWidget):
         self.status_message.emit(t("account_assigned", name=name), 3000)
         self.data_changed.emit()
 
-    def _on_delete_snapshot(self, snapshot_id: int) -> None:
-        reply = QMessageBox.warning(
+    def _confirm(self, title: str, text: str, on_ok: Callable[[], None]) -> None:
+        """Show a non-blocking Ok/Cancel warning and call on_ok if Ok is chosen.
+
+        open() instead of exec() keeps the main event loop running, so queued
+        signals are not handled re-entrantly inside a nested loop.
+        """
+        box = QMessageBox(
+            QMessageBox.Icon.Warning,
+            title,
+            text,
+            QMessageBox.StandardButton.Ok | QMessageBox.StandardButton.Cancel,
             self,
+        )
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        def on_finished(_result: int) -> None:
+            if box.standardButton(box.clickedButton()) == QMessageBox.StandardButton.Ok:
+                on_ok()
+
+        box.finished.connect(on_finished)
+        box.open()
+
+    def _on_delete_snapshot(self, snapshot_id: int) -> None:
+        self._confirm(
             t("delete_snapshot"),
             t("confirm_delete_snapshot"),
-            QMessageBox.StandardButton.Ok | QMessageBox.StandardButton.Cancel,
+            lambda: self._do_delete_snapshot(snapshot_id),
         )
-        if reply != QMessageBox.StandardButton.Ok:
-            return
+
+    def _do_delete_snapshot(self, snapshot_id: int) -> None:
         self._db.delete_snapshot(snapshot_id)
         self._refresh_table()
         self.status_message.emit(t("deleted_snapshot"), 3000)
@@ -226,15 +366,14 @@ class _CharDetailPanel(QWidget):
     def _on_delete_character(self) -> None:
         if self._character is None:
             return
-        reply = QMessageBox.warning(
-            self,
+        character = self._character
+        self._confirm(
             t("delete_character"),
-            t("confirm_delete_character", character=self._character),
-            QMessageBox.StandardButton.Ok | QMessageBox.StandardButton.Cancel,
+            t("confirm_delete_character", character=character),
+            lambda: self._do_delete_character(character),
         )
-        if reply != QMessageBox.StandardButton.Ok:
-            return
-        character = self._character
+
+    def _do_delete_character(self, character: str) -> None:
         self._db.delete_character(character)
         self.status_message.emit(t("deleted_character", character=character), 4000)
         self.data_changed.emit()
@@ -249,6 +388,8 @@ class DataManagementTab(QWidget):
         super().__init__(parent)
         self._db = db
         self._selected_character: str | None = None
+        # (character, account label) per row currently shown in _char_list
+        self._char_rows: list[tuple[str, str]] = []
 
         splitter = QSplitter(Qt.Orientation.Horizontal, self)
         root_layout = QVBoxLayout(self)
@@ -323,41 +464,59 @@ class DataManagementTab(QWidget):
 
     def refresh(self) -> None:
         """Reload all data from DB. Re-selects previously selected character if still present."""
-        self._rebuild_char_list()
-        self._rebuild_acct_tree()
+        characters = self._db.list_characters()
+        self._rebuild_char_list(characters)
+        self._rebuild_acct_tree(characters, self._db.list_accounts())
 
     # ── Private helpers ───────────────────────────────────────────────────
 
-    def _rebuild_char_list(self) -> None:
-        self._char_list.blockSignals(True)
-        self._char_list.clear()
-
-        characters = self._db.list_characters()
+    def _rebuild_char_list(self, characters: list[dict]) -> None:
+        # Patch the existing items in place rather than clear() + re-add, so a
+        # refresh after a single edit touches only the rows that changed.
+        no_account = t("no_account")
+        rows = [(c["character"], c["account_name"] or no_account) for c in characters]
         reselect_row = -1
-        for i, c in enumerate(characters):
-            account_name = c["account_name"] or t("no_account")
-            item = QListWidgetItem(f"{c['character']}  ·  {account_name}")
-            item.setData(Qt.ItemDataRole.UserRole, c["character"])
-            self._char_list.addItem(item)
-            if c["character"] == self._selected_character:
+        for i, (character, _) in enumerate(rows):
+            if character == self._selected_character:
                 reselect_row = i
+                break
 
+        self._char_list.blockSignals(True)
+        self._char_list.setUpdatesEnabled(False)
+        for i, row in enumerate(rows):
+            if i < len(self._char_rows) and self._char_rows[i] == row:
+                continue
+            character, account_name = row
+            text = f"{character}  ·  {account_name}"
+            if i < self._char_list.count():
+                item = self._char_list.item(i)
+                item.setText(text)
+            else:
+                item = QListWidgetItem(text)
+                self._char_list.addItem(item)
+            item.setData(Qt.ItemDataRole.UserRole, character)
+        while self._char_list.count() > len(rows):
+            self._char_list.takeItem(self._char_list.count() - 1)
+        self._char_rows = rows
+        self._char_list.setUpdatesEnabled(True)
         self._char_list.blockSignals(False)
 
         # setCurrentRow is intentionally called after blockSignals(False) so that
         # _on_char_selected fires and reloads the detail panel with fresh data.
         if reselect_row >= 0:
-            self._char_list.setCurrentRow(reselect_row)
+            if self._char_list.currentRow() == reselect_row:
+                # Same row stays current, so no currentRowChanged — reload directly
+                self._on_char_selected(reselect_row)
+            else:
+                self._char_list.setCurrentRow(reselect_row)
             self._right_stack.setCurrentIndex(1)
         else:
             self._selected_character = None
             self._char_list.setCurrentRow(-1)
             self._right_stack.setCurrentIndex(0)
 
-    def _rebuild_acct_tree(self) -> None:
+    def _rebuild_acct_tree(self, characters: list[dict], accounts: list[dict]) -> None:
         self._acct_tree.clear()
-        accounts = self._db.list_accounts()
-        characters = self._db.list_characters()
 
         # Group characters by account_id
         acct_chars: dict[int, list[str]] = {}
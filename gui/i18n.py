@@ -2,12 +2,15 @@
 Centralised UI strings for the Tthol Reader GUI.
 
 Usage:
-    from gui.i18n import t
+    from gui.i18n import T, t
 
-    label = QLabel(t("connect"))
+    label = QLabel(T.connect)      # plain strings are attributes on T
     msg = t("items_count", n=42)   # "共 42 個道具"
 """
 
+import sys
+from types import MappingProxyType, SimpleNamespace
+
 _STRINGS: dict[str, str] = {
     # ── Main window ──────────────────────────────────────────────────────
     "window_title": "武林小幫手",
@@ -142,8 +145,23 @@ _STRINGS: dict[str, str] = {
     "ac_total": "總計",
 }
 
+# One shared object per key and per string, so UI text compared against these
+# (combo selections, header labels) takes the identity fast path.
+_STRINGS = {sys.intern(k): sys.intern(v) for k, v in _STRINGS.items()}
+# Lookups go through the dict's own bound get(); the module-level name is a
+# read-only view so nothing can rewrite a translation at runtime.
+_lookup = _STRINGS.get
+_STRINGS = MappingProxyType(_STRINGS)
+
 
 def t(key: str, **kwargs: object) -> str:
     """Return the localised string for *key*, with optional format substitutions."""
-    s = _STRINGS.get(key, key)
+    s = _lookup(key, key)
+    # Formatted fresh each call: the values (counts, timestamps) rarely repeat, and
+    # a cache keyed on them would treat equal-hashing 1, 1.0 and True as one entry
     return s.format(**kwargs) if kwargs else s
+
+
+# Plain (non-format) strings as attributes: T.connect is an attribute fetch
+# instead of a call to t() plus a dict lookup. Format strings stay behind t().
+T = SimpleNamespace(**{k: v for k, v in _STRINGS.items() if k.isidentifier() and "{" not in v})
@@ -1,5 +1,12 @@
 """Item Overview tab: shows latest snapshots for all characters."""
 
+import sys
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from operator import attrgetter, itemgetter
+
+import numpy as np
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -15,43 +22,162 @@ from PySide6.QtWidgets import (
     QButtonGroup,
     QScrollArea,
     QFrame,
+    QStyledItemDelegate,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from gui.snapshot_db import SnapshotDB
-from gui.i18n import t
+from gui.i18n import T, t
 from gui.character_card import CharacterCard
 
 _MODE_BY_CHAR = "by_char"
 _MODE_BY_ITEM = "by_item"
 
-# Map raw DB source values to localised display strings.
-# Populated lazily after i18n is loaded (module-level call is fine for single-locale app).
-_SRC_DISPLAY: dict[str, str] = {}
+# UI strings are fixed for the life of the process (single-locale app), so the
+# filter sentinels and source label maps are resolved once at import.
+_ALL_CHARS = T.all_characters
+_ALL_SOURCES = T.all_sources
+
+# Raw DB source value -> localised display string, and back (for the source combo)
+_SRC_DISPLAY = {
+    "inventory": T.source_inventory,
+    "warehouse": T.source_warehouse,
+}
+_SRC_MAP = {label: sys.intern(source) for source, label in _SRC_DISPLAY.items()}
 
 
 def _src_label(source: str) -> str:
     """Return localised display string for a raw source value."""
-    if not _SRC_DISPLAY:
-        _SRC_DISPLAY["inventory"] = t("source_inventory")
-        _SRC_DISPLAY["warehouse"] = t("source_warehouse")
     return _SRC_DISPLAY.get(source, source)
 
 
-class InventoryManagerTab(QWidget):
-    ITEM_COLUMNS = [
-        t("mgr_col_name"),
-        t("mgr_col_type"),
-        t("mgr_col_item_id"),
-        t("mgr_col_total_qty"),
-        t("mgr_col_details"),
-    ]
+_ITEM_COLUMNS = (
+    T.mgr_col_name,
+    T.mgr_col_type,
+    T.mgr_col_item_id,
+    T.mgr_col_total_qty,
+    T.mgr_col_details,
+)
+
+
+# Delay after the last keystroke in the search box before the views are refiltered
+_SEARCH_DEBOUNCE_MS = 150
+
+
+@dataclass(slots=True)
+class _ItemAggregate:
+    """One By Item tree entry: an item's rows across all characters."""
+
+    item_id: int
+    name: str
+    name_lower: str  # what the search box matches against
+    item_type: str
+    total_qty: int = 0
+    rows: list[dict] = field(default_factory=list)  # sorted by character
+    char_count: int = 0  # distinct characters holding the item
+
+
+def _aggregate_items(rows: list[dict]) -> list[_ItemAggregate]:
+    """Group snapshot rows by item_id for the By Item tree, sorted by (item_type, name).
+
+    Rows must carry "name_lower" and "details" (see refresh()).
+    """
+    aggregated: dict[int, _ItemAggregate] = {}
+    for r in rows:
+        iid = r["item_id"]
+        agg = aggregated.get(iid)
+        if agg is None:
+            agg = aggregated[iid] = _ItemAggregate(
+                iid, r["name"], r["name_lower"], r.get("item_type", "")
+            )
+        agg.total_qty += r["qty"]
+        agg.rows.append(r)
+
+    items = sorted(aggregated.values(), key=attrgetter("item_type", "name"))
+    by_character = itemgetter("character")
+    for agg in items:
+        agg.rows.sort(key=by_character)
+        agg.char_count = len({r["character"] for r in agg.rows})
+    return items
+
+
+def _build_name_index(names) -> dict:
+    """Build a suffix trie over lowercased item *names*.
+
+    Every suffix of every name is inserted, so walking a query from the root
+    lands on the node for any name containing it; each node's None key holds
+    those names as a frozenset (None can't collide with a character key), so
+    lookups can hand it out without a copy.
+    """
+    root: dict = {}
+    for name in names:
+        for start in range(len(name)):
+            node = root
+            for ch in name[start:]:
+                node = node.setdefault(ch, {})
+                node.setdefault(None, set()).add(name)
+
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for ch, child in node.items():
+            if ch is None:
+                node[None] = frozenset(child)
+            else:
+                stack.append(child)
+    return root
+
 
+def _names_containing(index: dict, query: str) -> frozenset[str]:
+    """Return the indexed names that contain *query* (non-empty)."""
+    node = index
+    for ch in query:
+        node = node.get(ch)
+        if node is None:
+            return frozenset()
+    return node[None]
+
+
+_ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+class _RightAlignDelegate(QStyledItemDelegate):
+    """Right-aligns every cell of the columns it is installed on, so tree items
+    need no per-item setTextAlignment calls."""
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.displayAlignment = _ALIGN_RIGHT
+
+
+class InventoryManagerTab(QWidget):
     def __init__(self, db: SnapshotDB, parent=None):
         super().__init__(parent)
         self._db = db
         self._all_rows: list[dict] = []
+        # Characters the char combo was last filled with
+        self._combo_chars: tuple[str, ...] | None = None
+        # _all_rows aggregated per item, rebuilt only on refresh()
+        self._agg_cache: list[_ItemAggregate] = []
+        # Suffix trie over the distinct name_lower values, rebuilt only on refresh()
+        self._name_index: dict = {}
+        # Column copies of the fields the By Char filter compares, one entry per
+        # _all_rows row: name_lower as an int code, character and source
+        self._name_codes: dict[str, int] = {}
+        self._name_col = np.empty(0, dtype=np.int32)
+        self._char_col = np.empty(0, dtype=object)
+        self._src_col = np.empty(0, dtype=object)
+        # Top-level tree items for _agg_cache, and the cache they were built from
+        self._tree_items: list[QTreeWidgetItem] = []
+        self._tree_source: list[_ItemAggregate] | None = None
+        # item_id -> (signature, top-level item), so a refresh reuses the items of
+        # aggregates whose contents did not change
+        self._item_nodes: dict[int, tuple[tuple, QTreeWidgetItem]] = {}
         self._mode = _MODE_BY_ITEM
+        # Per view: whether it must be repopulated before being shown, and the
+        # footer text it last produced
+        self._dirty = {_MODE_BY_CHAR: True, _MODE_BY_ITEM: True}
+        self._footer_texts = {_MODE_BY_CHAR: "", _MODE_BY_ITEM: ""}
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -61,22 +187,27 @@ class InventoryManagerTab(QWidget):
         filter_bar = QHBoxLayout()
 
         self._search = QLineEdit()
-        self._search.setPlaceholderText(t("search_placeholder"))
+        self._search.setPlaceholderText(T.search_placeholder)
         self._search.setMaximumWidth(220)
-        self._search.textChanged.connect(self._apply_filter)
+        # Typing restarts a single-shot timer, so a burst of keystrokes refilters once
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_filter)
+        self._search.textChanged.connect(lambda _text: self._search_timer.start())
         filter_bar.addWidget(self._search)
 
         self._char_combo = QComboBox()
-        self._char_combo.addItem(t("all_characters"))
+        self._char_combo.addItem(_ALL_CHARS)
         self._char_combo.currentIndexChanged.connect(self._apply_filter)
         filter_bar.addWidget(self._char_combo)
 
         self._source_combo = QComboBox()
         self._source_combo.addItems(
             [
-                t("all_sources"),
-                t("source_inventory"),
-                t("source_warehouse"),
+                _ALL_SOURCES,
+                _SRC_DISPLAY["inventory"],
+                _SRC_DISPLAY["warehouse"],
             ]
         )
         self._source_combo.currentIndexChanged.connect(self._apply_filter)
@@ -84,13 +215,13 @@ class InventoryManagerTab(QWidget):
 
         filter_bar.addStretch()
 
-        self._btn_by_char = QPushButton(t("by_char"))
+        self._btn_by_char = QPushButton(T.by_char)
         self._btn_by_char.setObjectName("toggle_left")
         self._btn_by_char.setCheckable(True)
         self._btn_by_char.clicked.connect(lambda: self._set_mode(_MODE_BY_CHAR))
         filter_bar.addWidget(self._btn_by_char)
 
-        self._btn_by_item = QPushButton(t("by_item"))
+        self._btn_by_item = QPushButton(T.by_item)
         self._btn_by_item.setObjectName("toggle_right")
         self._btn_by_item.setCheckable(True)
         self._btn_by_item.clicked.connect(lambda: self._set_mode(_MODE_BY_ITEM))
@@ -118,16 +249,23 @@ class InventoryManagerTab(QWidget):
         self._char_scroll.setWidget(self._char_container)
         self._stack.addWidget(self._char_scroll)
         self._cards: dict[str, CharacterCard] = {}
+        self._card_order: list[str] = []  # characters of the cards, in layout order
 
         # Index 1: By Item tree
         self._tree = QTreeWidget()
-        self._tree.setColumnCount(len(self.ITEM_COLUMNS))
-        self._tree.setHeaderLabels(self.ITEM_COLUMNS)
+        self._tree.setColumnCount(len(_ITEM_COLUMNS))
+        self._tree.setHeaderLabels(_ITEM_COLUMNS)
         self._tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        # Item ID and quantity columns are numeric
+        self._right_align = _RightAlignDelegate(self._tree)
+        self._tree.setItemDelegateForColumn(2, self._right_align)
+        self._tree.setItemDelegateForColumn(3, self._right_align)
         self._tree.setEditTriggers(QTreeWidget.EditTrigger.NoEditTriggers)
         self._tree.setSelectionBehavior(QTreeWidget.SelectionBehavior.SelectRows)
         self._tree.setAlternatingRowColors(True)
         self._tree.setRootIsDecorated(True)
+        # All rows are single-line text, so one measured row height fits every item
+        self._tree.setUniformRowHeights(True)
         self._stack.addWidget(self._tree)
 
         layout.addWidget(self._stack)
@@ -142,7 +280,28 @@ class InventoryManagerTab(QWidget):
     # ------------------------------------------------------------------
     def refresh(self):
         """Reload from DB and re-apply current filters."""
-        self._all_rows = self._db.load_latest_snapshots()
+        rows = self._db.load_latest_snapshots()
+        # Prepare the values the filters compare against once per load: the
+        # lowercased name for the search box, and interned character/source so
+        # equal strings are the same object and comparisons short-circuit on identity.
+        # The By Item "details" text is formatted here too, once per row.
+        for r in rows:
+            r["name_lower"] = r["name"].lower()
+            r["character"] = sys.intern(r["character"])
+            r["source"] = sys.intern(r["source"])
+            r["details"] = f"{_src_label(r['source'])} · {r['scanned_at']}"
+        self._all_rows = rows
+        self._agg_cache = _aggregate_items(rows)
+        name_codes: dict[str, int] = {}
+        self._name_col = np.fromiter(
+            (name_codes.setdefault(r["name_lower"], len(name_codes)) for r in rows),
+            dtype=np.int32,
+            count=len(rows),
+        )
+        self._char_col = np.array([r["character"] for r in rows], dtype=object)
+        self._src_col = np.array([r["source"] for r in rows], dtype=object)
+        self._name_codes = name_codes
+        self._name_index = _build_name_index(name_codes)
         self._rebuild_char_combo()
         self._apply_filter()
 
@@ -156,128 +315,198 @@ class InventoryManagerTab(QWidget):
         self._char_combo.setVisible(not is_by_item)
         self._source_combo.setVisible(not is_by_item)
         self._stack.setCurrentIndex(1 if is_by_item else 0)
-        if not initial:
+        if initial:
+            return
+        if self._dirty[mode]:
             self._apply_filter()
+        else:
+            self._footer.setText(self._footer_texts[mode])
 
     def _rebuild_char_combo(self):
-        chars = sorted({r["character"] for r in self._all_rows})
+        chars = tuple(sorted({r["character"] for r in self._all_rows}))
+        if chars == self._combo_chars:
+            return
+        self._combo_chars = chars
         current = self._char_combo.currentText()
         self._char_combo.blockSignals(True)
         self._char_combo.clear()
-        self._char_combo.addItem(t("all_characters"))
-        for c in chars:
-            self._char_combo.addItem(c)
+        self._char_combo.addItem(_ALL_CHARS)
+        self._char_combo.addItems(chars)
         idx = self._char_combo.findText(current) if current else -1
         self._char_combo.setCurrentIndex(idx if idx >= 0 else 0)
         self._char_combo.blockSignals(False)
 
     def _apply_filter(self):
+        # Only the visible view is rebuilt; the other is marked stale and
+        # rebuilt when _set_mode switches to it.
+        for mode in self._dirty:
+            self._dirty[mode] = True
         if self._mode == _MODE_BY_ITEM:
             self._populate_tree()
         else:
             self._populate_cards()
+        self._dirty[self._mode] = False
+        self._footer_texts[self._mode] = self._footer.text()
+
+    def _matching_names(self) -> frozenset[str] | None:
+        """Names matching the search box, or None when it is empty."""
+        name_filter = self._search.text().strip().lower()
+        if not name_filter:
+            return None
+        return _names_containing(self._name_index, name_filter)
 
     def _populate_cards(self):
         """Populate the By Char scrollable card list."""
-        name_filter = self._search.text().strip().lower()
+        names = self._matching_names()
         char_filter = self._char_combo.currentText()
         source_filter = self._source_combo.currentText()
 
-        _all_chars = t("all_characters")
-        _all_sources = t("all_sources")
-        _src_map = {
-            t("source_inventory"): "inventory",
-            t("source_warehouse"): "warehouse",
-        }
-
-        visible = []
-        for r in self._all_rows:
-            if name_filter and name_filter not in r["name"].lower():
-                continue
-            if char_filter != _all_chars and r["character"] != char_filter:
-                continue
-            if source_filter != _all_sources and r["source"] != _src_map.get(
-                source_filter, source_filter
-            ):
-                continue
-            visible.append(r)
+        # Resolve every filter once; None means "don't filter on this field"
+        want_char = None if char_filter == _ALL_CHARS else sys.intern(char_filter)
+        want_src = (
+            None
+            if source_filter == _ALL_SOURCES
+            else _SRC_MAP.get(source_filter) or sys.intern(source_filter)
+        )
+
+        # Each filter is a boolean mask over the column copies, combined with &
+        mask = np.ones(len(self._all_rows), dtype=bool)
+        if names is not None:
+            mask &= np.isin(self._name_col, [self._name_codes[n] for n in names])
+        if want_char is not None:
+            mask &= self._char_col == want_char
+        if want_src is not None:
+            mask &= self._src_col == want_src
+        rows = self._all_rows
+        visible = [rows[i] for i in np.flatnonzero(mask)]
 
         # Group by character
         by_char: dict[str, list[dict]] = {}
         for r in visible:
             by_char.setdefault(r["character"], []).append(r)
 
-        # Remove cards for characters no longer in filtered set
-        removed = [c for c in list(self._cards) if c not in by_char]
-        for char in removed:
-            card = self._cards.pop(char)
-            card.setParent(None)
-            card.deleteLater()
-
-        # Insert / update cards in alphabetical order
-        sorted_chars = sorted(by_char.keys())
-        for i, char in enumerate(sorted_chars):
-            rows = by_char[char]
-            if char in self._cards:
-                card = self._cards[char]
-                card.update_rows(rows)
-                # Reposition if needed (stretch is last item, so layout count = cards + 1)
-                current_pos = self._char_layout.indexOf(card)
-                if current_pos != i:
+        # Card removals, updates and inserts are applied with the container's
+        # updates off, so it lays out and repaints once at the end.
+        self._char_container.setUpdatesEnabled(False)
+        try:
+            # Cards are pooled: a card filtered out by the search or combos is
+            # hidden and reused when it matches again; only cards of characters
+            # gone from the DB are deleted.
+            known = {r["character"] for r in self._all_rows}
+            for char in [c for c in self._cards if c not in known]:
+                card = self._cards.pop(char)
+                self._card_order.remove(char)
+                card.setParent(None)
+                card.deleteLater()
+            for char, card in self._cards.items():
+                if char not in by_char and not card.isHidden():
+                    card.hide()
+
+            # Shown or hidden, every card stays in alphabetical order in the
+            # layout, so existing cards never move and a new card is inserted at
+            # its sorted position (`_card_order` mirrors the layout order).
+            for char, rows in by_char.items():
+                card = self._cards.get(char)
+                if card is None:
+                    card = CharacterCard(char, rows, self._db)
+                    self._cards[char] = card
+                    i = bisect_left(self._card_order, char)
+                    self._card_order.insert(i, char)
                     self._char_layout.insertWidget(i, card)
-            else:
-                card = CharacterCard(char, rows, self._db)
-                self._cards[char] = card
-                self._char_layout.insertWidget(i, card)
+                else:
+                    card.update_rows(rows)
+                    if card.isHidden():
+                        card.show()
+        finally:
+            self._char_container.setUpdatesEnabled(True)
 
         self._footer.setText(t("footer_items", n=len(visible)))
 
     def _populate_tree(self):
-        """Populate the By Item aggregated tree."""
-        name_filter = self._search.text().strip().lower()
+        """Populate the By Item aggregated tree.
+
+        The tree items are built once per refresh() (one per _agg_cache entry);
+        a search only hides or shows them.
+        """
+        if self._tree_source is not self._agg_cache:
+            self._build_tree_items()
 
-        aggregated: dict[int, dict] = {}
-        for r in self._all_rows:
-            if name_filter and name_filter not in r["name"].lower():
-                continue
-            iid = r["item_id"]
-            if iid not in aggregated:
-                aggregated[iid] = {
-                    "item_id": iid,
-                    "name": r["name"],
-                    "item_type": r.get("item_type", ""),
-                    "total_qty": 0,
-                    "rows": [],
-                }
-            aggregated[iid]["total_qty"] += r["qty"]
-            aggregated[iid]["rows"].append(r)
-
-        items_sorted = sorted(aggregated.values(), key=lambda x: (x["item_type"], x["name"]))
-
-        self._tree.clear()
+        names = self._matching_names()
+        kinds = 0
         total_qty = 0
-        for item in items_sorted:
-            total_qty += item["total_qty"]
-            char_count = len({r["character"] for r in item["rows"]})
-
-            parent = QTreeWidgetItem(self._tree)
-            parent.setText(0, item["name"])
-            parent.setText(1, item["item_type"])
-            parent.setText(2, str(item["item_id"]))
-            parent.setText(3, str(item["total_qty"]))
-            parent.setText(4, t("char_count", n=char_count))
-            parent.setTextAlignment(2, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            parent.setTextAlignment(3, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-
-            for r in sorted(item["rows"], key=lambda x: x["character"]):
-                child = QTreeWidgetItem(parent)
-                child.setText(0, r["character"])
-                child.setText(1, "")
-                child.setText(2, "")
-                child.setText(3, str(r["qty"]))
-                child.setText(4, f"{_src_label(r['source'])} · {r['scanned_at']}")
-                child.setTextAlignment(
-                    3, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-                )
-
-        self._footer.setText(t("summary_kinds_total", kinds=len(items_sorted), total=total_qty))
+        self._tree.setUpdatesEnabled(False)
+        try:
+            for agg, tree_item in zip(self._agg_cache, self._tree_items):
+                hidden = names is not None and agg.name_lower not in names
+                if tree_item.isHidden() != hidden:
+                    tree_item.setHidden(hidden)
+                if not hidden:
+                    kinds += 1
+                    total_qty += agg.total_qty
+        finally:
+            self._tree.setUpdatesEnabled(True)
+
+        self._footer.setText(t("summary_kinds_total", kinds=kinds, total=total_qty))
+
+    def _build_tree_items(self):
+        """Rebuild the tree's items from _agg_cache.
+
+        Items whose aggregate is unchanged since the last build are reused;
+        only new or changed aggregates get fresh items.
+        """
+        # Items are built detached and inserted in bulk (addChildren /
+        # addTopLevelItems) with sorting, updates and signals off, so the view
+        # reacts once instead of once per item.
+        old_nodes = self._item_nodes
+        nodes = {}
+        parents = []
+        for item in self._agg_cache:
+            sig = (
+                item.name,
+                item.item_type,
+                item.total_qty,
+                tuple((r["character"], r["qty"], r["details"]) for r in item.rows),
+            )
+            cached = old_nodes.get(item.item_id)
+            if cached is not None and cached[0] == sig:
+                parent = cached[1]
+            else:
+                parent = self._new_tree_item(item)
+            nodes[item.item_id] = (sig, parent)
+            parents.append(parent)
+
+        was_sorting = self._tree.isSortingEnabled()
+        self._tree.setSortingEnabled(False)
+        self._tree.setUpdatesEnabled(False)
+        self._tree.blockSignals(True)
+        try:
+            # takeChildren() detaches without deleting, so reused items survive
+            self._tree.invisibleRootItem().takeChildren()
+            self._tree.addTopLevelItems(parents)
+        finally:
+            self._tree.blockSignals(False)
+            self._tree.setUpdatesEnabled(True)
+            self._tree.setSortingEnabled(was_sorting)
+        self._tree_items = parents
+        self._tree_source = self._agg_cache
+        self._item_nodes = nodes
+
+    @staticmethod
+    def _new_tree_item(item: _ItemAggregate) -> QTreeWidgetItem:
+        """Build the top-level tree item for *item*, with one child per row."""
+        parent = QTreeWidgetItem(
+            [
+                item.name,
+                item.item_type,
+                str(item.item_id),
+                str(item.total_qty),
+                t("char_count", n=item.char_count),
+            ]
+        )
+        parent.addChildren(
+            [
+                QTreeWidgetItem([r["character"], "", "", str(r["qty"]), r["details"]])
+                for r in item.rows
+            ]
+        )
+        return parent
@@ -29,11 +29,9 @@ _SKIP_PREFIXES = (
 def format_pip_line(line: str) -> str | None:
     """Return a cleaned pip output line to display, or None to skip it."""
     stripped = line.strip()
-    if not stripped:
+    # startswith() takes the whole tuple and tests every prefix in one C call
+    if not stripped or stripped.startswith(_SKIP_PREFIXES):
         return None
-    for prefix in _SKIP_PREFIXES:
-        if stripped.startswith(prefix):
-            return None
     return stripped
 
 
@@ -78,8 +76,9 @@ class UpdateWorker(QThread):
             text=True,
             encoding="utf-8",
             errors="replace",
+            bufsize=1,  # line-buffered, so the log follows the process line by line
         )
-        for raw_line in proc.stdout:
+        for raw_line in iter(proc.stdout.readline, ""):
             self.line_ready.emit(raw_line.rstrip())
         proc.wait()
 
@@ -108,8 +107,9 @@ class UpdateWorker(QThread):
             text=True,
             encoding="utf-8",
             errors="replace",
+            bufsize=1,
         )
-        for raw_line in proc.stdout:
+        for raw_line in iter(proc.stdout.readline, ""):
             display = format_pip_line(raw_line)
             if display:
                 self.line_ready.emit(display)
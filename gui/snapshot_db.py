@@ -54,6 +54,10 @@ class SnapshotDB:
         db_path = path or str(DEFAULT_DB)
         self._con = sqlite3.connect(db_path)
         self._con.row_factory = sqlite3.Row
+        # WAL lets GUI-thread reads proceed without waiting on writes, and with
+        # WAL, synchronous=NORMAL only fsyncs at checkpoints instead of every commit.
+        self._con.execute("PRAGMA journal_mode=WAL")
+        self._con.execute("PRAGMA synchronous=NORMAL")
         self._con.executescript(SCHEMA)
         self._con.commit()
 
@@ -201,6 +205,41 @@ class SnapshotDB:
             )
         return result
 
+    def snapshots_key(self, character: str) -> tuple[int, int | None]:
+        """
+        Return a cheap (count, max id) fingerprint of a character's snapshots.
+        Any save or delete for the character changes it.
+        """
+        row = self._con.execute(
+            "SELECT COUNT(*), MAX(id) FROM snapshots WHERE character=?", (character,)
+        ).fetchone()
+        return (row[0], row[1])
+
+    def load_detail(
+        self, character: str, known_key: tuple | None = None
+    ) -> tuple[list[dict], dict | None, tuple[int, int | None], list[dict] | None]:
+        """
+        Return everything the data management detail panel shows for a character:
+        (list_accounts(), get_character_account(character), snapshots_key(character),
+        list_all_snapshots(character)), read within a single transaction.
+        If the snapshots key equals known_key, the caller's snapshot list is still
+        current and None is returned in its place.
+        """
+        in_transaction = self._con.in_transaction
+        if not in_transaction:
+            self._con.execute("BEGIN")
+        try:
+            key = self.snapshots_key(character)
+            return (
+                self.list_accounts(),
+                self.get_character_account(character),
+                key,
+                None if key == known_key else self.list_all_snapshots(character),
+            )
+        finally:
+            if not in_transaction:
+                self._con.commit()
+
     def list_accounts(self) -> list[dict]:
         """Return all accounts as list of {id, name}."""
         rows = self._con.execute("SELECT id, name FROM accounts ORDER BY name").fetchall()
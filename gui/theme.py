@@ -13,6 +13,8 @@ Shared accent colors (both modes):
     ORANGE = #F97316
 """
 
+from functools import cache, lru_cache
+
 from gui.config import save_theme
 
 # ── Shared accents (kept as module constants for val_color params) ─────────────
@@ -130,9 +132,16 @@ class ThemeManager:
 
 
 # ── Dynamic style helpers ─────────────────────────────────────────────────────
+# The helpers below are memoized on everything their output depends on (theme
+# mode or palette colors included), so repeated ticks reuse the same strings.
 def badge_style(state: str) -> str:
     """Return inline QSS for the connection-state pill badge."""
-    badges = _STATE_BADGE_DARK if ThemeManager._mode == "dark" else _STATE_BADGE_LIGHT
+    return _badge_style(ThemeManager._mode, state)
+
+
+@cache
+def _badge_style(mode: str, state: str) -> str:
+    badges = _STATE_BADGE_DARK if mode == "dark" else _STATE_BADGE_LIGHT
     bg, border, color = badges.get(state, badges["DISCONNECTED"])
     return (
         f"color: {color}; background-color: {bg}; "
@@ -143,8 +152,11 @@ def badge_style(state: str) -> str:
 
 def vital_html(key: str, val, val_color: str | None = None) -> str:
     """Render a simple vital field: dim key + bright value."""
-    dim = ThemeManager.c("DIM")
-    text = val_color or ThemeManager.c("TEXT")
+    return _vital_html(ThemeManager.c("DIM"), val_color or ThemeManager.c("TEXT"), key, val)
+
+
+@lru_cache(maxsize=256)
+def _vital_html(dim: str, text: str, key: str, val) -> str:
     return (
         f'<span style="color:{dim};font-size:10px;letter-spacing:1px;">{key}</span>'
         f"&thinsp;"
@@ -154,8 +166,11 @@ def vital_html(key: str, val, val_color: str | None = None) -> str:
 
 def fraction_html(key: str, cur, mx, val_color: str = GREEN) -> str:
     """Render a cur/max vital: dim key + colored cur + muted /max."""
-    dim = ThemeManager.c("DIM")
-    muted = ThemeManager.c("MUTED")
+    return _fraction_html(ThemeManager.c("DIM"), ThemeManager.c("MUTED"), val_color, key, cur, mx)
+
+
+@lru_cache(maxsize=256)
+def _fraction_html(dim: str, muted: str, val_color: str, key: str, cur, mx) -> str:
     return (
         f'<span style="color:{dim};font-size:10px;letter-spacing:1px;">{key}</span>'
         f"&thinsp;"
@@ -681,6 +696,21 @@ QFrame#char_card_header {{
     border-radius: 8px 8px 0 0;
     padding: 0 4px;
 }}
+QLabel#char_card_name {{
+    color: {TEXT};
+    font-weight: 700;
+    padding: 2px 8px;
+}}
+QLabel#char_card_account {{
+    color: {MUTED};
+    font-size: 9pt;
+    padding: 0 6px;
+}}
+QLabel#char_card_time {{
+    color: {DIM};
+    font-size: 9pt;
+    padding: 0 6px;
+}}
 
 /* ── Auto-click tab ─────────────────────────────────────────── */
 QPushButton#merchant_btn {{
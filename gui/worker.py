@@ -10,6 +10,8 @@ States:
 """
 
 import threading
+from dataclasses import dataclass
+
 import pymem
 from PySide6.QtCore import QThread, Signal
 
@@ -45,10 +47,46 @@ FAILURE_THRESHOLD = 3  # consecutive failures before rescan
 LOCATE_RETRY_INTERVAL = 3.0  # seconds between locate retries
 LOCATE_MAX_RETRIES = 10  # give up after this many retries (~30s)
 
+# Knowledge field names backing Stats' vitals, in Stats field order (hp .. y)
+_VITAL_FIELD_NAMES = (
+    "血量",
+    "最大血量",
+    "真氣",
+    "最大真氣",
+    "負重",
+    "最大負重",
+    "等級",
+    "X座標",
+    "Y座標",
+)
+
+
+@dataclass(slots=True)
+class Stats:
+    """One poll of character stats, emitted by ReaderWorker.stats_updated.
+
+    The vitals are plain attributes so the GUI needs no per-tick dict; a vital
+    missing from the knowledge file is "---".  `fields` is the full list of
+    (name, value) tuples for the status tab.
+    """
+
+    name: str
+    map_name: str
+    hp: int | str
+    hp_max: int | str
+    mp: int | str
+    mp_max: int | str
+    wt: int | str
+    wt_max: int | str
+    lv: int | str
+    x: int | str
+    y: int | str
+    fields: list
+
 
 class ReaderWorker(QThread):
     state_changed = Signal(str)  # new state string
-    stats_updated = Signal(list)  # list of (name, value) tuples
+    stats_updated = Signal(object)  # Stats
     inventory_ready = Signal(list)  # list of (item_id, qty, name)
     warehouse_ready = Signal(list)  # list of (item_id, qty, name)
     scan_error = Signal(str)  # human-readable error message
@@ -64,6 +102,9 @@ class ReaderWorker(QThread):
         self._scan_warehouse = False
         self._knowledge = load_knowledge()
         self._display_fields = get_display_fields(self._knowledge)
+        # Position of each vital in read_all_fields' result (None if not displayed)
+        positions = {name: i for i, (_, name) in enumerate(self._display_fields)}
+        self._vital_positions = tuple(positions.get(name) for name in _VITAL_FIELD_NAMES)
         self._item_db = load_item_db()
 
     # ------------------------------------------------------------------
@@ -157,8 +198,14 @@ class ReaderWorker(QThread):
                 else:
                     failure_count = 0
                     map_name = locate_map_name(pm)
+                    vitals = ["---" if i is None else fields[i][1] for i in self._vital_positions]
                     self.stats_updated.emit(
-                        [("角色名稱", char_name), ("地圖名稱", map_name)] + fields
+                        Stats(
+                            char_name,
+                            map_name,
+                            *vitals,
+                            fields=[("角色名稱", char_name), ("地圖名稱", map_name)] + fields,
+                        )
                     )
 
             except Exception:
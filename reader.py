@@ -6,6 +6,7 @@ Scans memory to locate character struct, then displays stats and inventory.
 import pymem
 import ctypes
 import ctypes.wintypes
+import functools
 import struct
 import json
 import sqlite3
@@ -30,15 +31,15 @@ def read_hp_from_player_chain(pm):
     try:
         addr = PLAYER_HP_CHAIN_BASE
         for off in PLAYER_HP_CHAIN_OFFSETS:
-            ptr = struct.unpack("<I", pm.read_bytes(addr, 4))[0]
+            ptr = read_pointer(pm, addr)
             if ptr == 0 or ptr > 0x7FFFFFFF:
                 return None
             addr = ptr + off
-        hp = pm.read_int(addr)
+        hp = _read_scalar(pm, addr, ctypes.c_int32)
         if hp <= 0 or hp > 500000:
             return None
         return hp
-    except Exception:
+    except (OSError, ctypes.ArgumentError):
         return None
 
 
@@ -58,10 +59,103 @@ class MEMORY_BASIC_INFORMATION(ctypes.Structure):
 
 
 MEM_COMMIT = 0x1000
+MEM_PRIVATE = 0x20000
 READABLE_PAGES = (0x04, 0x08, 0x40, 0x80)
+# PAGE_READWRITE / PAGE_EXECUTE_READWRITE: what heap allocations are committed as
+PRIVATE_RW_PAGES = (0x04, 0x40)
+
+_INT32 = struct.Struct("<i")
+
+# What a failed pm.read_bytes() (pymem) or _read_scalar() raises
+_READ_ERRORS = (pymem.exception.MemoryReadError, OSError)
+
+
+@functools.cache
+def _read_process_memory():
+    """kernel32.ReadProcessMemory with its argument and return types declared.
+
+    Loaded from a private WinDLL so the prototype does not change the shared
+    ctypes.windll.kernel32 function other callers use.
+    """
+    func = ctypes.WinDLL("kernel32").ReadProcessMemory
+    func.argtypes = (
+        ctypes.wintypes.HANDLE,
+        ctypes.wintypes.LPCVOID,
+        ctypes.wintypes.LPVOID,
+        ctypes.c_size_t,
+        ctypes.POINTER(ctypes.c_size_t),
+    )
+    func.restype = ctypes.wintypes.BOOL
+    return func
+
+
+def _read_scalar(pm, address, ctype):
+    """Read one ctypes scalar (e.g. c_uint32) with a single ReadProcessMemory call.
+
+    Skips the bytes object + struct.unpack round trip of pm.read_bytes().
+    Raises OSError if the read fails.
+    """
+    buf = ctype()
+    if not _read_process_memory()(
+        pm.process_handle, address, ctypes.byref(buf), ctypes.sizeof(buf), None
+    ):
+        raise OSError(f"ReadProcessMemory failed at 0x{address:08X}")
+    return buf.value
+
+
+def read_pointer(pm, address):
+    """Read an unsigned 32-bit pointer.  Raises OSError if the read fails."""
+    return _read_scalar(pm, address, ctypes.c_uint32)
+
+
+# Addresses closer than this many bytes are fetched by one read in scatter_read()
+SCATTER_MAX_GAP = 512
+
 
+def scatter_read(pm, addrs, size=4):
+    """Read *size* bytes at each address in *addrs* with as few calls as possible.
 
-def get_memory_regions(process_handle):
+    Addresses are sorted and merged into spans whose gaps are at most
+    SCATTER_MAX_GAP bytes; each span costs one ReadProcessMemory call instead
+    of one per address.  If a span read fails, its addresses are retried one
+    by one.  Returns a list aligned with *addrs*: bytes, or None where the
+    read failed.
+    """
+    results = [None] * len(addrs)
+    order = sorted(range(len(addrs)), key=addrs.__getitem__)
+    i = 0
+    while i < len(order):
+        span_start = addrs[order[i]]
+        span_end = span_start + size
+        j = i + 1
+        while j < len(order) and addrs[order[j]] - span_end <= SCATTER_MAX_GAP:
+            span_end = max(span_end, addrs[order[j]] + size)
+            j += 1
+        try:
+            raw = pm.read_bytes(span_start, span_end - span_start)
+        except _READ_ERRORS:
+            raw = None
+        for k in order[i:j]:
+            if raw is not None:
+                rel = addrs[k] - span_start
+                results[k] = raw[rel : rel + size]
+            else:
+                try:
+                    results[k] = pm.read_bytes(addrs[k], size)
+                except _READ_ERRORS:
+                    results[k] = None
+        i = j
+    return results
+
+
+def get_memory_regions(process_handle, only_private_rw=False):
+    """Return [(base, size)] for every committed, readable region.
+
+    only_private_rw: keep only MEM_PRIVATE read/write regions (heap and
+    VirtualAlloc memory), skipping image and file-mapped pages.  Use it when
+    looking for runtime game state; pointer-chain scans must keep image
+    regions because chains start inside module memory.
+    """
     regions = []
     address = 0
     mbi = MEMORY_BASIC_INFORMATION()
@@ -73,7 +167,9 @@ def get_memory_regions(process_handle):
             break
         base = mbi.BaseAddress or 0
         region_size = mbi.RegionSize
-        if mbi.State == MEM_COMMIT and mbi.Protect in READABLE_PAGES:
+        readable = mbi.State == MEM_COMMIT and mbi.Protect in READABLE_PAGES
+        private_rw = mbi.Type == MEM_PRIVATE and mbi.Protect in PRIVATE_RW_PAGES
+        if readable and (private_rw or not only_private_rw):
             regions.append((base, region_size))
         address = base + region_size
         if region_size == 0:
@@ -81,6 +177,28 @@ def get_memory_regions(process_handle):
     return regions
 
 
+class RegionCache:
+    """Snapshot of region contents: each (base, size) is read from the process at most once.
+
+    Multi-pass analyses (BFS levels, repeated pattern searches) reuse the same
+    bytes object instead of copying every region again on each pass.  The
+    returned bytes support both bytes.find() and zero-copy np.frombuffer().
+    Failed reads are not cached and re-raise on every call.
+    """
+
+    def __init__(self, pm):
+        self._pm = pm
+        self._buffers: dict[tuple[int, int], bytes] = {}
+
+    def get(self, base, size):
+        key = (base, size)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._pm.read_bytes(base, size)
+            self._buffers[key] = buffer
+        return buffer
+
+
 # ============================================================
 # 知識庫
 # ============================================================
@@ -452,8 +570,38 @@ def read_character_name(pm, hp_addr):
         return ""
 
 
-def read_all_fields(pm, hp_addr, display_fields):
-    """Read all known integer fields."""
+def read_all_fields(pm, hp_addr, display_fields, snapshot=None):
+    """Read all known integer fields.
+
+    The whole field span is copied with a single read and unpacked locally.
+    If that read fails (e.g. the span touches an unreadable page), each field
+    is read on its own so readable fields still come through.
+
+    snapshot: optional (buffer, base_addr) already copied from the process, e.g.
+    the bytes around a candidate a scan just read.  When it covers the whole field
+    span the values are unpacked from it directly and the process is not read at all.
+    """
+    if not display_fields:
+        return []
+    lo = min(offset for offset, _ in display_fields)
+    hi = max(offset for offset, _ in display_fields) + 4
+
+    if snapshot is not None:
+        buffer, base = snapshot
+        start = hp_addr + lo - base
+        if start >= 0 and start + (hi - lo) <= len(buffer):
+            return [
+                (name, _INT32.unpack_from(buffer, start + offset - lo)[0])
+                for offset, name in display_fields
+            ]
+
+    try:
+        raw = pm.read_bytes(hp_addr + lo, hi - lo)
+    except _READ_ERRORS:
+        raw = None
+    if raw is not None:
+        return [(name, _INT32.unpack_from(raw, offset - lo)[0]) for offset, name in display_fields]
+
     result = []
     for offset, name in display_fields:
         try:
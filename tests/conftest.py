@@ -0,0 +1,22 @@
+class FakePM:
+    """Stand-in for pymem.Pymem that serves reads from bytes regions and counts read_bytes calls."""
+
+    process_handle = 0
+
+    def __init__(self, base, data):
+        self.regions = [(base, bytes(data))]
+        self.calls = 0
+
+    @classmethod
+    def from_regions(cls, regions):
+        """A FakePM over several (base, bytes) regions, e.g. one per memory region."""
+        pm = cls(0, b"")
+        pm.regions = [(base, bytes(data)) for base, data in regions]
+        return pm
+
+    def read_bytes(self, address, size):
+        self.calls += 1
+        for base, data in self.regions:
+            if base <= address and address + size <= base + len(data):
+                return data[address - base : address - base + size]
+        raise OSError("unreadable")
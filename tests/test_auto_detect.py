@@ -0,0 +1,116 @@
+import struct
+
+from tests.conftest import FakePM
+
+# A plausible character struct, as {offset relative to HP: int32 value}
+VALID = {
+    -96: 30,  # 外功
+    -88: 40,  # 根骨
+    -80: 50,  # 技巧
+    -36: 50,  # 等級
+    0: 5000,  # 血量
+    4: 6000,  # 最大血量
+    8: 800,  # 真氣
+    12: 900,  # 最大真氣
+    24: 100,  # 負重
+    28: 2000,  # 最大負重
+    72: 300,  # 物攻
+    76: 290,  # 物攻基礎
+    84: 200,  # 防禦
+    92: 150,  # 命中
+    96: 120,  # 閃躲
+}
+
+# Every check exactly at its limit: MaxHP = 3 * HP, HP = 10 * level, zero weight,
+# combat stats equal to HP, attack base exactly half the attack away
+BOUNDARY = {
+    **VALID,
+    -36: 10,
+    0: 100,
+    4: 300,
+    8: 1,
+    12: 3,
+    24: 0,
+    28: 1,
+    72: 100,
+    76: 50,
+    84: 100,
+    92: 100,
+    96: 100,
+}
+
+REJECTED = [
+    {**BOUNDARY, 4: 301},  # MaxHP just above 3 * HP
+    {**BOUNDARY, -36: 11},  # HP below 10 * level
+    {**BOUNDARY, 76: 49},  # attack base too far from attack
+    {**BOUNDARY, 96: 101},  # combat stat above HP
+    {**VALID, 0: 800_000_000, 4: 900_000_000},  # HP * 3 wraps in int32
+    {**VALID, 76: -(2**31)},  # attack - base would wrap in int32
+    # Incrementing fake-data sequence: MaxHP = HP + 1 and MP next to MaxHP
+    {**VALID, 0: 1000, 4: 1001, 8: 1000, 12: 1001},
+]
+
+REGION_SIZE = 0x1000
+# First and last HP positions the scan looks at in a region
+FIRST_POS = 96
+LAST_POS = REGION_SIZE - 104
+
+
+def _region(planted):
+    """A zeroed region with each {pos: struct} planted at its HP position."""
+    data = bytearray(REGION_SIZE)
+    for pos, fields in planted.items():
+        for off, value in fields.items():
+            struct.pack_into("<i", data, pos + off, value)
+    return bytes(data)
+
+
+def test_scan_for_character_applies_every_check(monkeypatch):
+    import auto_detect
+
+    regions = [
+        (0x100000, _region({FIRST_POS: VALID, 0x800: BOUNDARY})),
+        (0x200000, _region({LAST_POS: VALID})),
+        (0x300000, _region({FIRST_POS + 0x100 * i: s for i, s in enumerate(REJECTED)})),
+    ]
+    pm = FakePM.from_regions(regions)
+    monkeypatch.setattr(
+        auto_detect, "get_memory_regions", lambda handle, **kw: [(b, len(d)) for b, d in regions]
+    )
+
+    candidates, knowledge = auto_detect.scan_for_character(pm)
+
+    assert [c["addr"] for c in candidates] == [
+        0x100000 + FIRST_POS,
+        0x100000 + 0x800,
+        0x200000 + LAST_POS,
+    ]
+    first = candidates[0]
+    assert (first["hp"], first["max_hp"], first["mp"], first["max_mp"]) == (5000, 6000, 800, 900)
+    assert first["level"] == 50 and first["stats"] == (30, 40, 50)
+    assert (first["atk"], first["defense"]) == (300, 200)
+
+
+def test_candidate_snapshot_covers_only_the_display_fields(monkeypatch):
+    import auto_detect
+    from reader import get_display_fields, read_all_fields
+
+    regions = [(0x100000, _region({0x800: VALID}))]
+    pm = FakePM.from_regions(regions)
+    monkeypatch.setattr(
+        auto_detect, "get_memory_regions", lambda handle, **kw: [(b, len(d)) for b, d in regions]
+    )
+    (candidate,), knowledge = auto_detect.scan_for_character(pm)
+
+    display_fields = get_display_fields(knowledge)
+    lo = min(offset for offset, _ in display_fields)
+    hi = max(offset for offset, _ in display_fields) + 4
+    buffer, base = candidate["snapshot"]
+    # Just the field span around HP is kept, not the whole region
+    assert base == candidate["addr"] + lo
+    assert len(buffer) == hi - lo
+
+    reads = pm.calls
+    fields = read_all_fields(pm, candidate["addr"], display_fields, candidate["snapshot"])
+    assert pm.calls == reads
+    assert fields == read_all_fields(pm, candidate["addr"], display_fields)
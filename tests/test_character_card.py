@@ -1,6 +1,7 @@
 """Tests for CharacterCard widget."""
 
 import pytest
+from PySide6.QtCore import Qt
 from gui.character_card import CharacterCard
 from gui.snapshot_db import SnapshotDB
 
@@ -87,4 +88,50 @@ def test_card_table_has_rows(db, qtbot):
     ]
     card = CharacterCard("Alice", rows, db)
     qtbot.addWidget(card)
-    assert card._table.rowCount() == 2
+    assert card._model.rowCount() == 2
+
+
+def test_card_sorts_quantity_numerically(db, qtbot):
+    rows = [
+        {
+            "character": "Alice",
+            "source": "inventory",
+            "item_id": item_id,
+            "qty": qty,
+            "name": name,
+            "scanned_at": "2026-01-01T10:00:00",
+            "account": None,
+        }
+        for item_id, qty, name in [(1, 10, "Sword"), (2, 9, "Shield"), (3, 100, "Potion")]
+    ]
+    card = CharacterCard("Alice", rows, db)
+    qtbot.addWidget(card)
+    card._table.sortByColumn(2, Qt.SortOrder.AscendingOrder)
+    view_model = card._table.model()
+    assert [view_model.index(i, 2).data() for i in range(3)] == ["9", "10", "100"]
+
+
+def test_card_update_rows_applies_changes(db, qtbot):
+    def row(item_id, qty, name):
+        return {
+            "character": "Alice",
+            "source": "inventory",
+            "item_id": item_id,
+            "qty": qty,
+            "name": name,
+            "scanned_at": "2026-01-01T10:00:00",
+            "account": None,
+        }
+
+    card = CharacterCard("Alice", [row(1, 5, "Sword"), row(2, 3, "Shield")], db)
+    qtbot.addWidget(card)
+
+    # Only the delta is applied; the model is never reset
+    with qtbot.assertNotEmitted(card._model.modelReset):
+        card.update_rows([row(1, 7, "Sword"), row(3, 1, "Potion")])
+
+    model = card._model
+    contents = sorted(
+        (model.index(i, 1).data(), model.index(i, 2).data()) for i in range(model.rowCount())
+    )
+    assert contents == [("Potion", "1"), ("Sword", "7")]
@@ -49,3 +49,13 @@ def test_save_theme_raises_on_invalid_mode(tmp_path):
     cfg = tmp_path / "config.json"
     with pytest.raises(ValueError, match="Invalid theme"):
         save_theme("invalid", cfg)
+
+
+def test_save_theme_preserves_other_keys(tmp_path):
+    cfg = tmp_path / "config.json"
+    cfg.write_text(json.dumps({"theme": "dark", "lang": "en"}), encoding="utf-8")
+    assert load_theme(cfg) == "dark"
+    save_theme("light", cfg)
+    save_theme("dark", cfg)
+    data = json.loads(cfg.read_text(encoding="utf-8"))
+    assert data == {"theme": "dark", "lang": "en"}
@@ -1,6 +1,8 @@
 """Tests for DataManagementTab."""
 
 import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QMessageBox
 from gui.data_management_tab import DataManagementTab
 from gui.snapshot_db import SnapshotDB
 
@@ -52,3 +54,100 @@ def test_tab_reselects_character_after_refresh(db, qtbot):
     tab._char_list.setCurrentRow(0)
     tab.refresh()
     assert tab._selected_character == "Alice"
+
+
+def test_detail_panel_lists_snapshots(db, qtbot):
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 1}])
+    db.save_snapshot("Alice", "warehouse", [{"item_id": 2, "qty": 3}])
+    tab = DataManagementTab(db)
+    qtbot.addWidget(tab)
+    tab._char_list.setCurrentRow(0)
+    model = tab._detail_panel._snap_model
+    assert model.rowCount() == 2
+    # the delete column carries the snapshot id for the delegate
+    ids = {model.index(r, 3).data(Qt.ItemDataRole.UserRole) for r in range(2)}
+    assert ids == {s["id"] for s in db.list_all_snapshots("Alice")}
+
+
+def _answer_confirm(panel, button):
+    box = panel.findChild(QMessageBox)
+    assert box is not None and box.isVisible()
+    box.button(button).click()
+
+
+def test_delete_snapshot_refreshes_table(db, qtbot):
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 1}])
+    db.save_snapshot("Alice", "warehouse", [{"item_id": 2, "qty": 3}])
+    tab = DataManagementTab(db)
+    qtbot.addWidget(tab)
+    tab._char_list.setCurrentRow(0)
+    panel = tab._detail_panel
+    snap_id = panel._snap_model.index(0, 3).data(Qt.ItemDataRole.UserRole)
+    panel._delete_delegate.delete_requested.emit(snap_id)
+    # The confirmation is non-blocking: nothing is deleted until it is answered
+    assert panel._snap_model.rowCount() == 2
+    _answer_confirm(panel, QMessageBox.StandardButton.Ok)
+    assert panel._snap_model.rowCount() == 1
+
+
+def test_delete_button_responds_to_click_and_space(db, qtbot):
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 1}])
+    tab = DataManagementTab(db)
+    qtbot.addWidget(tab)
+    tab.show()
+    tab._char_list.setCurrentRow(0)
+    panel = tab._detail_panel
+    table = panel._snap_table
+    index = panel._snap_model.index(0, 3)
+    snap_id = index.data(Qt.ItemDataRole.UserRole)
+
+    center = table.visualRect(index).center()
+    with qtbot.waitSignal(panel._delete_delegate.delete_requested) as blocker:
+        qtbot.mouseClick(table.viewport(), Qt.MouseButton.LeftButton, pos=center)
+    assert blocker.args == [snap_id]
+    _answer_confirm(panel, QMessageBox.StandardButton.Cancel)
+    qtbot.waitUntil(lambda: panel.findChild(QMessageBox) is None)
+
+    table.setFocus()
+    table.setCurrentIndex(index)
+    with qtbot.waitSignal(panel._delete_delegate.delete_requested) as blocker:
+        qtbot.keyClick(table, Qt.Key.Key_Space)
+    assert blocker.args == [snap_id]
+    _answer_confirm(panel, QMessageBox.StandardButton.Cancel)
+
+
+def test_delete_snapshot_cancel_keeps_row(db, qtbot):
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 1}])
+    tab = DataManagementTab(db)
+    qtbot.addWidget(tab)
+    tab._char_list.setCurrentRow(0)
+    panel = tab._detail_panel
+    panel._on_delete_snapshot(panel._snap_model.index(0, 3).data(Qt.ItemDataRole.UserRole))
+    _answer_confirm(panel, QMessageBox.StandardButton.Cancel)
+    assert len(db.list_all_snapshots("Alice")) == 1
+
+
+def test_refresh_patches_char_list_in_place(db, qtbot):
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 1}])
+    db.save_snapshot("Bob", "inventory", [{"item_id": 1, "qty": 1}])
+    tab = DataManagementTab(db)
+    qtbot.addWidget(tab)
+    items = [tab._char_list.item(i) for i in range(tab._char_list.count())]
+    account_id = db.create_account("Main")
+    db.set_character_account("Bob", account_id)
+    tab.refresh()
+    assert [tab._char_list.item(i) for i in range(tab._char_list.count())] == items
+    bob = next(item for item in items if item.data(Qt.ItemDataRole.UserRole) == "Bob")
+    assert "Main" in bob.text()
+
+
+def test_reload_after_account_edit_keeps_snapshot_table(db, qtbot):
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 1}])
+    tab = DataManagementTab(db)
+    qtbot.addWidget(tab)
+    tab._char_list.setCurrentRow(0)
+    model = tab._detail_panel._snap_model
+    db.set_character_account("Alice", db.create_account("Main"))
+    with qtbot.assertNotEmitted(model.modelReset):
+        tab.refresh()
+    assert model.rowCount() == 1
@@ -0,0 +1,24 @@
+import threading
+
+from tests.conftest import FakePM
+
+
+def test_dump_strings_near_hp_skips_lone_lead_bytes(capsys):
+    from find_name import dump_strings_near_hp
+
+    name = "角色名稱".encode("big5")
+    # Lead bytes followed by a byte that cannot be a trail byte used to stall the scan
+    data = b"\x81\x00\x81\x00" + name + bytes(32 - 4 - len(name))
+    pm = FakePM(0x1000, data)
+
+    # Run in a thread so a regression fails the test instead of hanging the suite
+    worker = threading.Thread(
+        target=dump_strings_near_hp,
+        args=(pm, 0x1008),
+        kwargs={"before": 8, "after": 24},
+        daemon=True,
+    )
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert "HP+-4  '角色名稱'  [big5]" in capsys.readouterr().out
@@ -0,0 +1,89 @@
+import random
+import struct
+
+from tests.conftest import FakePM
+
+
+def _reference_matches(buffer, targets, search_range):
+    """Plain per-word loop: (word_index, offset, target_index) in buffer then target order."""
+    words = struct.unpack(f"<{len(buffer) // 4}I", buffer)
+    return [
+        (w, t - p, ti)
+        for w, p in enumerate(words)
+        for ti, t in enumerate(targets)
+        if 0 <= t - p <= search_range
+    ]
+
+
+def test_match_pointers_matches_plain_loop():
+    import numpy as np
+
+    from find_stable_chain import SEARCH_RANGE, SMALL_TARGET_SET, _match_pointers
+
+    rng = random.Random(7)
+    for n_targets in (1, SMALL_TARGET_SET, SMALL_TARGET_SET + 5):
+        targets = sorted(rng.sample(range(0x10000, 0x20000, 4), n_targets))
+        # Pointers near the targets (some matching several), plus noise and the
+        # values where unsigned wrap-around would bite
+        values = [t - rng.choice([0, 4, SEARCH_RANGE, SEARCH_RANGE + 4]) for t in targets]
+        values += [rng.randrange(0, 2**32) for _ in range(200)]
+        values += [0, 1, 0xFFFFFFFF, targets[0] + 4, targets[-1] - SEARCH_RANGE - 4]
+        rng.shuffle(values)
+        buffer = struct.pack(f"<{len(values)}I", *values)
+
+        target_addrs = np.array(targets, dtype=np.int64)
+        word_idx, offsets, tgt_idx = _match_pointers(
+            buffer, target_addrs, targets[0] - SEARCH_RANGE, targets[-1]
+        )
+        got = list(zip(word_idx.tolist(), offsets.tolist(), tgt_idx.tolist()))
+        assert got == _reference_matches(buffer, targets, SEARCH_RANGE)
+
+
+def test_in_range_mask_clamps_and_does_not_wrap():
+    import numpy as np
+
+    from find_stable_chain import _in_range_mask
+
+    ptrs = np.array([0, 5, 6, 0xFFFFFFFF], dtype="<u4")
+    # A negative low bound is clamped to 0 instead of wrapping to a huge value
+    assert _in_range_mask(ptrs, -10, 5).tolist() == [True, True, False, False]
+    assert _in_range_mask(ptrs, 6, 0xFFFFFFFF).tolist() == [False, False, True, True]
+    assert _in_range_mask(ptrs, 10, 5).tolist() == [False] * 4
+
+
+def test_resolve_chain_addrs_follows_and_drops_chains():
+    from find_stable_chain import resolve_chain_addrs
+
+    base = 0x1000
+    mem = bytearray(0x100)
+    struct.pack_into("<I", mem, 0x10, base + 0x40)  # valid: -> 0x1040
+    struct.pack_into("<I", mem, 0x44, base + 0x80)  # [0x1044] -> 0x1080
+    struct.pack_into("<I", mem, 0x20, 0)  # null pointer
+    struct.pack_into("<I", mem, 0x30, 0x9000)  # points outside readable memory
+    struct.pack_into("<I", mem, 0x34, 0x80000000)  # above the user address range
+    pm = FakePM(base, mem)
+
+    chains = [
+        ("game.exe", 0x10, (4, 8)),  # two hops: [0x1010]+4 -> [0x1044]+8
+        ("game.exe", 0x20, (0, 0)),  # dead at the first hop
+        ("game.exe", 0x30, (0, 0)),  # second hop reads unreadable memory
+        ("game.exe", 0x34, (0,)),  # pointer out of range
+        ("other.dll", 0x10, (0,)),  # module not loaded
+        ("game.exe", 0x10, (4,)),  # shorter chain stops after its own hops
+        ("game.exe", 0x40, ()),  # no hops: the module address itself
+    ]
+    assert resolve_chain_addrs(pm, {"game.exe": base}, chains) == [
+        base + 0x88,
+        None,
+        None,
+        None,
+        None,
+        base + 0x44,
+        base + 0x40,
+    ]
+
+
+def test_resolve_chain_addrs_empty():
+    from find_stable_chain import resolve_chain_addrs
+
+    assert resolve_chain_addrs(FakePM(0, b""), {}, []) == []
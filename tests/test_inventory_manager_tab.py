@@ -1,7 +1,13 @@
 """Tests for InventoryManagerTab By Char card list view."""
 
 import pytest
-from gui.inventory_manager_tab import InventoryManagerTab, _MODE_BY_CHAR
+from gui.inventory_manager_tab import (
+    InventoryManagerTab,
+    _MODE_BY_CHAR,
+    _MODE_BY_ITEM,
+    _build_name_index,
+    _names_containing,
+)
 from gui.snapshot_db import SnapshotDB
 
 
@@ -27,3 +33,93 @@ def test_tab_by_char_has_no_flat_table(db, qtbot):
     qtbot.addWidget(tab)
     # The old flat QTableWidget for By Char should not exist
     assert not hasattr(tab, "_table")
+
+
+def test_by_item_tree_aggregates_and_debounces_search(db, qtbot):
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 2}])
+    db.save_snapshot("Bob", "warehouse", [{"item_id": 1, "qty": 3}])
+    tab = InventoryManagerTab(db)
+    qtbot.addWidget(tab)
+    assert tab._tree.topLevelItemCount() == 1
+    parent = tab._tree.topLevelItem(0)
+    assert parent.text(3) == "5"
+    assert [parent.child(i).text(0) for i in range(parent.childCount())] == ["Alice", "Bob"]
+
+    tab._search.setText("no such item")
+    # Refiltering waits for the debounce timer, then hides the existing item
+    assert not parent.isHidden()
+    qtbot.waitUntil(lambda: parent.isHidden())
+    assert tab._tree.topLevelItem(0) is parent
+
+    tab._search.setText("")
+    qtbot.waitUntil(lambda: not parent.isHidden())
+    # A refresh reuses items whose aggregate is unchanged and rebuilds the rest
+    tab.refresh()
+    assert tab._tree.topLevelItem(0) is parent
+    db.save_snapshot("Bob", "warehouse", [{"item_id": 1, "qty": 4}])
+    tab.refresh()
+    assert tab._tree.topLevelItem(0) is not parent
+    assert tab._tree.topLevelItem(0).text(3) == "6"
+
+
+def test_hidden_view_is_rebuilt_only_when_shown(db, qtbot):
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 1}])
+    tab = InventoryManagerTab(db)
+    qtbot.addWidget(tab)
+    # Starts in By Item: the card list has not been built yet
+    assert tab._cards == {}
+    tab._set_mode(_MODE_BY_CHAR)
+    assert "Alice" in tab._cards
+    tab._set_mode(_MODE_BY_ITEM)
+    assert not tab._dirty[_MODE_BY_ITEM]
+
+
+def test_cards_stay_in_alphabetical_order(db, qtbot):
+    db.save_snapshot("Carol", "inventory", [{"item_id": 1, "qty": 1}])
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 1}])
+    tab = InventoryManagerTab(db)
+    qtbot.addWidget(tab)
+    tab._set_mode(_MODE_BY_CHAR)
+    db.save_snapshot("Bob", "inventory", [{"item_id": 2, "qty": 1}])
+    tab.refresh()
+    layout = tab._char_layout
+    shown = [layout.itemAt(i).widget()._character for i in range(len(tab._cards))]
+    assert shown == ["Alice", "Bob", "Carol"] == tab._card_order
+
+
+def test_filtered_out_cards_are_hidden_and_reused(db, qtbot):
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 1}])
+    db.save_snapshot("Bob", "inventory", [{"item_id": 2, "qty": 1}])
+    tab = InventoryManagerTab(db)
+    qtbot.addWidget(tab)
+    tab._set_mode(_MODE_BY_CHAR)
+    alice = tab._cards["Alice"]
+    tab._char_combo.setCurrentText("Bob")
+    assert alice.isHidden() and not tab._cards["Bob"].isHidden()
+    tab._char_combo.setCurrentIndex(0)
+    assert tab._cards["Alice"] is alice and not alice.isHidden()
+
+
+def test_char_combo_rebuilt_only_when_characters_change(db, qtbot):
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 1}])
+    tab = InventoryManagerTab(db)
+    qtbot.addWidget(tab)
+    tab._char_combo.setCurrentText("Alice")
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 2}])
+    tab.refresh()
+    assert tab._combo_chars == ("Alice",)
+    db.save_snapshot("Bob", "inventory", [{"item_id": 1, "qty": 1}])
+    tab.refresh()
+    combo = tab._char_combo
+    assert [combo.itemText(i) for i in range(1, combo.count())] == ["Alice", "Bob"]
+    assert combo.currentText() == "Alice"
+
+
+def test_name_index_matches_substrings():
+    index = _build_name_index({"金創藥", "小金創藥", "$pack"})
+    assert _names_containing(index, "金創") == {"金創藥", "小金創藥"}
+    assert _names_containing(index, "小") == {"小金創藥"}
+    assert _names_containing(index, "$p") == {"$pack"}
+    assert _names_containing(index, "藥x") == set()
+    # The index hands out its own sets, so they must be immutable
+    assert isinstance(_names_containing(index, "金"), frozenset)
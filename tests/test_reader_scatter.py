@@ -0,0 +1,25 @@
+from tests.conftest import FakePM
+
+
+def test_scatter_read_coalesces_nearby_addresses():
+    from reader import scatter_read
+
+    pm = FakePM(0x1000, bytes(range(256)) * 4)
+    result = scatter_read(pm, [0x1010, 0x1000, 0x1008], size=4)
+    assert result == [bytes([16, 17, 18, 19]), bytes([0, 1, 2, 3]), bytes([8, 9, 10, 11])]
+    assert pm.calls == 1
+
+
+def test_scatter_read_failed_span_falls_back_per_address():
+    from reader import scatter_read
+
+    pm = FakePM(0x1000, bytes(16))
+    # 0x100E + 4 runs past the end, so the merged span fails and both are retried
+    result = scatter_read(pm, [0x1000, 0x100E], size=4)
+    assert result == [bytes(4), None]
+
+
+def test_scatter_read_empty():
+    from reader import scatter_read
+
+    assert scatter_read(FakePM(0, b""), []) == []
@@ -78,3 +78,28 @@ def test_list_characters_no_account_returns_none(db):
 def test_list_characters_empty_when_no_snapshots(db):
     chars = db.list_characters()
     assert chars == []
+
+
+def test_load_detail_returns_accounts_assignment_and_snapshots(db):
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 1}])
+    acct_id = db.create_account("Main")
+    db.set_character_account("Alice", acct_id)
+    accounts, account, key, snapshots = db.load_detail("Alice")
+    assert accounts == db.list_accounts()
+    assert account == {"id": acct_id, "name": "Main"}
+    assert key == db.snapshots_key("Alice")
+    assert snapshots == db.list_all_snapshots("Alice")
+    assert not db._con.in_transaction
+
+
+def test_load_detail_skips_unchanged_snapshots(db):
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 1}])
+    key = db.snapshots_key("Alice")
+    assert db.load_detail("Alice", known_key=key)[3] is None
+    db.save_snapshot("Alice", "inventory", [{"item_id": 1, "qty": 2}])
+    assert db.snapshots_key("Alice") != key
+    assert len(db.load_detail("Alice", known_key=key)[3]) == 2
+
+
+def test_connection_uses_wal(db):
+    assert db._con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
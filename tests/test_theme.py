@@ -119,3 +119,15 @@ def test_badge_style_light_mode_returns_different_colors():
     # Light mode LOCATED badge should have light green bg (DCFCE7), not dark (#0D2417)
     assert "#DCFCE7" in result
     assert "#0D2417" not in result
+
+
+def test_badge_style_cache_follows_theme_toggle():
+    from gui.theme import badge_style
+
+    dark = badge_style("LOCATED")
+    with patch("gui.theme.save_theme"):
+        ThemeManager.toggle()
+        light = badge_style("LOCATED")
+        ThemeManager.toggle()
+    assert light != dark
+    assert badge_style("LOCATED") == dark
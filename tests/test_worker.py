@@ -15,3 +15,12 @@ def test_connect_process_uses_pid_positionally():
         result = worker._connect_process()
     mock_pymem.assert_called_once_with(1234)
     assert result is mock_pm
+
+
+def test_vital_positions_index_display_fields():
+    """Stats vitals are taken from read_all_fields' result by precomputed position."""
+    from gui.worker import _VITAL_FIELD_NAMES
+
+    worker = ReaderWorker(pid=1234)
+    for name, i in zip(_VITAL_FIELD_NAMES, worker._vital_positions):
+        assert i is not None and worker._display_fields[i][1] == name